@@ -162,7 +162,7 @@ def change_own_password(username: str, old_password: str, new_password: str) ->
     if username == SUPER_ADMIN['username']:
         return False, "Super admin wachtwoord kan niet gewijzigd worden"
     
-    # Verify old password
+    # Verify old password first, so a wrong one is always logged whatever the new password is
     user = get_user_by_username(username)
     if not user or not check_password(old_password, user['password_hash']):
         log_event(f"Mislukte wachtwoord wijziging", username, "Verkeerd huidig wachtwoord")
@@ -172,9 +172,9 @@ def change_own_password(username: str, old_password: str, new_password: str) ->
     if not validate_password(new_password):
         return False, "Nieuw wachtwoord voldoet niet aan eisen"
     
-    # Update password
+    # Update password, only if the hash that was just verified is still the stored one
     password_hash = hash_password(new_password)
-    if reset_user_password(username, password_hash):
+    if reset_user_password(username, password_hash, user['password_hash']):
         log_event(f"Wachtwoord succesvol gewijzigd", username)
         return True, "Wachtwoord succesvol gewijzigd"
     else:
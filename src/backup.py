@@ -2,9 +2,11 @@ import os
 import zipfile
 import shutil
 from datetime import datetime
-from db import log_event, get_restore_code, use_restore_code
+from db import (init_db, log_event, flush_logs, get_restore_code, use_restore_code, invalidate_read_cache,
+                reset_connections)
 
 BACKUP_DIR = 'backups/'
+BACKUP_DIR_ABS = os.path.abspath(BACKUP_DIR)
 DATA_DIR = 'data/'
 DB_FILE = 'data/data.db'
 LOG_FILE = 'logs.db'
@@ -32,6 +34,8 @@ def create_backup(username: str) -> str:
     backup_path = os.path.join(BACKUP_DIR, backup_name)
     
     try:
+        # Make sure queued log events are part of the backup
+        flush_logs()
         with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # Add main database file
             if os.path.exists(DB_FILE):
@@ -61,6 +65,7 @@ Versie: Urban Mobility Backend System v1.0
 """
             zipf.writestr("backup_info.txt", metadata)
         
+        invalidate_backup_cache()
         log_event(f"Backup succesvol aangemaakt", username, f"Backup bestand: {backup_name}")
         return backup_name
         
@@ -68,51 +73,98 @@ Versie: Urban Mobility Backend System v1.0
         log_event(f"Backup aanmaken mislukt", username, f"Fout: {str(e)}", suspicious=False)
         raise Exception(f"Fout bij aanmaken backup: {e}")
 
-def list_backups() -> list:
+# Result of the last backup directory scan, keyed on the directory mtime
+_backup_list_cache = {'mtime': None, 'data': None}
+# Creator read from each backup zip, keyed on filename and reused while (mtime, size) is unchanged
+_backup_creator_cache = {}
+# Statistics derived from the cached listing, valid while that listing is the same object
+_backup_stats_cache = {'data': None, 'stats': None}
+
+def invalidate_backup_cache():
+    """Force the next list_backups() call to rescan the backup directory"""
+    _backup_list_cache['mtime'] = None
+
+def list_backups() -> tuple:
     """
-    List all available backup files with their information
-    Returns list of dictionaries with backup info
+    List all available backup files with their information, newest first
+    Returns a tuple of dictionaries with backup info, shared until the directory changes
     """
-    ensure_backup_dir()
+    try:
+        mtime = os.stat(BACKUP_DIR).st_mtime_ns
+    except FileNotFoundError:
+        ensure_backup_dir()
+        mtime = os.stat(BACKUP_DIR).st_mtime_ns
     
+    # Reuse the previous scan as long as no file was added or removed
+    if _backup_list_cache['mtime'] != mtime:
+        _backup_list_cache['data'] = tuple(_scan_backups())
+        _backup_list_cache['mtime'] = mtime
+    
+    return _backup_list_cache['data']
+
+def _read_backup_creator(filepath: str) -> str:
+    """
+    Read the creator from the backup_info.txt inside a backup zip
+    """
+    try:
+        with zipfile.ZipFile(filepath, 'r') as zipf:
+            if 'backup_info.txt' in zipf.namelist():
+                info_content = zipf.read('backup_info.txt').decode('utf-8')
+                # Parse creator from backup info
+                for line in info_content.split('\n'):
+                    if 'Aangemaakt door:' in line:
+                        return line.split(':', 1)[1].strip()
+                    elif 'Created by:' in line:  # Fallback for English
+                        return line.split(':', 1)[1].strip()
+    except:
+        pass  # If we can't read info, use defaults
+    return 'Onbekend'
+
+def _scan_backups() -> list:
+    """
+    Read file stats and metadata of every backup in the backup directory
+    """
     backups = []
+    seen = set()
     
     try:
-        for filename in os.listdir(BACKUP_DIR):
-            if filename.endswith('.zip') and filename.startswith('backup_'):
+        with os.scandir(BACKUP_DIR) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not (filename.endswith('.zip') and filename.startswith('backup_')):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
                 filepath = os.path.join(BACKUP_DIR, filename)
                 
-                # Get file stats
-                stat = os.stat(filepath)
+                # Get file stats (cached on the directory entry)
+                stat = entry.stat(follow_symlinks=False)
                 size = stat.st_size
                 created = datetime.fromtimestamp(stat.st_ctime)
                 
-                # Try to read backup info from zip
-                backup_info = {
+                # Only open the zip when the file is new or has changed since the last scan
+                file_key = (stat.st_mtime_ns, size)
+                cached = _backup_creator_cache.get(filename)
+                if cached and cached[0] == file_key:
+                    creator = cached[1]
+                else:
+                    creator = _read_backup_creator(filepath)
+                    _backup_creator_cache[filename] = (file_key, creator)
+                seen.add(filename)
+                
+                backups.append({
                     'filename': filename,
                     'filepath': filepath,
                     'size': size,
                     'created': created,
-                    'creator': 'Onbekend',
+                    'created_display': created.strftime('%d-%m-%Y %H:%M'),
+                    'creator': creator,
                     'size_mb': round(size / (1024 * 1024), 2)
-                }
-                
-                try:
-                    with zipfile.ZipFile(filepath, 'r') as zipf:
-                        if 'backup_info.txt' in zipf.namelist():
-                            info_content = zipf.read('backup_info.txt').decode('utf-8')
-                            # Parse creator from backup info
-                            for line in info_content.split('\n'):
-                                if 'Aangemaakt door:' in line:
-                                    backup_info['creator'] = line.split(':', 1)[1].strip()
-                                    break
-                                elif 'Created by:' in line:  # Fallback for English
-                                    backup_info['creator'] = line.split(':', 1)[1].strip()
-                                    break
-                except:
-                    pass  # If we can't read info, use defaults
-                
-                backups.append(backup_info)
+                })
+        
+        # Forget files that are no longer in the backup directory
+        for filename in _backup_creator_cache.keys() - seen:
+            del _backup_creator_cache[filename]
         
         # Sort by creation date (newest first)
         backups.sort(key=lambda x: x['created'], reverse=True)
@@ -166,7 +218,9 @@ def restore_backup(backup_filename: str, username: str, restore_code: str = None
         # Create backup of current state before restoring
         current_backup = create_backup(f"auto_voor_restore_{username}")
         
-        # Extract backup
+        # Extract backup (pending log events still belong to the old database)
+        flush_logs()
+        reset_connections()
         ensure_data_dir()
         
         with zipfile.ZipFile(backup_path, 'r') as zipf:
@@ -189,6 +243,10 @@ def restore_backup(backup_filename: str, username: str, restore_code: str = None
             if 'logs.db' in contents:
                 zipf.extract('logs.db', '.')
         
+        # The database file was replaced, cached reads are stale and older backups may need migrating
+        invalidate_read_cache()
+        init_db()
+        
         # Mark restore code as used (if applicable)
         if not is_super_admin and restore_code:
             use_restore_code(restore_code)
@@ -207,12 +265,12 @@ def delete_backup(backup_filename: str, username: str) -> bool:
     backup_path = os.path.join(BACKUP_DIR, backup_filename)
     
     try:
-        if os.path.exists(backup_path):
-            os.remove(backup_path)
-            log_event(f"Backup verwijderd", username, f"Backup: {backup_filename}")
-            return True
-        else:
-            return False
+        os.unlink(backup_path)
+        invalidate_backup_cache()
+        log_event(f"Backup verwijderd", username, f"Backup: {backup_filename}")
+        return True
+    except FileNotFoundError:
+        return False
     except Exception as e:
         log_event(f"Backup verwijderen mislukt", username, f"Backup: {backup_filename}, Fout: {str(e)}")
         return False
@@ -279,6 +337,7 @@ def cleanup_old_backups(keep_count: int = 10, username: str = "systeem") -> int:
             log_event(f"Fout bij verwijderen oude backup", username, f"Backup: {backup['filename']}, Fout: {str(e)}")
     
     if deleted_count > 0:
+        invalidate_backup_cache()
         log_event(f"Oude backups opgeruimd", username, f"{deleted_count} backups verwijderd, {keep_count} behouden")
     
     return deleted_count
@@ -334,22 +393,27 @@ def get_backup_statistics() -> dict:
     Get backup statistics
     """
     backups = list_backups()
+    if _backup_stats_cache['data'] is backups:
+        return _backup_stats_cache['stats']
     
     if not backups:
-        return {
+        stats = {
             'total_backups': 0,
             'total_size_mb': 0,
             'oldest_backup': None,
             'newest_backup': None,
             'average_size_mb': 0
         }
+    else:
+        total_size = sum(backup['size'] for backup in backups)
+        stats = {
+            'total_backups': len(backups),
+            'total_size_mb': round(total_size / (1024 * 1024), 2),
+            'oldest_backup': backups[-1]['created_display'],
+            'newest_backup': backups[0]['created_display'],
+            'average_size_mb': round((total_size / len(backups)) / (1024 * 1024), 2)
+        }
     
-    total_size = sum(backup['size'] for backup in backups)
-    
-    return {
-        'total_backups': len(backups),
-        'total_size_mb': round(total_size / (1024 * 1024), 2),
-        'oldest_backup': backups[-1]['created'].strftime('%d-%m-%Y %H:%M'),
-        'newest_backup': backups[0]['created'].strftime('%d-%m-%Y %H:%M'),
-        'average_size_mb': round((total_size / len(backups)) / (1024 * 1024), 2)
-    }
\ No newline at end of file
+    _backup_stats_cache['data'] = backups
+    _backup_stats_cache['stats'] = stats
+    return stats
\ No newline at end of file
@@ -1,22 +1,108 @@
 import sqlite3
 import os
+import atexit
+import queue
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from encryption import encrypt_data, decrypt_data
 
 DB_PATH = 'data/data.db'
 
+# Incremented whenever a suspicious event is logged, so cached counts can be invalidated
+_suspicious_log_version = 0
+
 def ensure_data_dir():
     """Ensure data directory exists"""
     if not os.path.exists('data'):
         os.makedirs('data')
 
+# Write counters per table; cached full-table reads are only reused while the counter is unchanged
+_table_versions = {'users': 0, 'travellers': 0, 'scooters': 0}
+_read_cache = {}
+# Most recent search results per (table, search term), validated against the same counters
+_search_cache = OrderedDict()
+SEARCH_CACHE_SIZE = 8
+# Set by init_db when the trigram full-text index for scooter search is available
+_scooter_fts = False
+
+def _frozen(records):
+    """Tuple of read-only views of the records, so results shared through the caches cannot be changed"""
+    return tuple(MappingProxyType(record) for record in records)
+
+def invalidate_read_cache():
+    """Drop all cached table reads, e.g. after the database file was replaced"""
+    _read_cache.clear()
+    _search_cache.clear()
+
+def _cached_search(table, search_term):
+    """Return cached search results if the table has not been written since, else None"""
+    key = (table, search_term)
+    cached = _search_cache.get(key)
+    if cached is None or cached[0] != _table_versions[table]:
+        return None
+    _search_cache.move_to_end(key)
+    return cached[1]
+
+def _store_search(table, search_term, version, results):
+    """Remember search results as read-only records and return them, evicting the least recently
+    used entry when full"""
+    results = _frozen(results)
+    _search_cache[(table, search_term)] = (version, results)
+    _search_cache.move_to_end((table, search_term))
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+    return results
+
+# One connection per thread (main thread and log writer), kept open so SQLite's prepared
+# statement cache survives between calls; bumping the generation makes every thread reconnect
+_conn_local = threading.local()
+_conn_generation = 0
+
 def get_db():
-    """Get database connection"""
-    ensure_data_dir()
-    return sqlite3.connect(DB_PATH)
+    """Get this thread's database connection"""
+    conn = getattr(_conn_local, 'conn', None)
+    if conn is None or _conn_local.generation != _conn_generation:
+        if conn is not None:
+            conn.close()
+        ensure_data_dir()
+        conn = sqlite3.connect(DB_PATH, cached_statements=256)
+        _conn_local.conn = conn
+        _conn_local.generation = _conn_generation
+    return conn
+
+def reset_connections():
+    """Close the shared connections, e.g. before the database file is replaced"""
+    global _conn_generation
+    _conn_generation += 1
+    conn = getattr(_conn_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _conn_local.conn = None
+
+# Per column, the condition under which the validation triggers reject a scooter row (see init_db)
+_SCOOTER_INVALID_COLUMNS = (
+    ('top_speed', "NEW.top_speed <= 0"),
+    ('battery_capacity', "NEW.battery_capacity <= 0"),
+    ('state_of_charge', "NEW.state_of_charge NOT BETWEEN 0 AND 100"),
+    ('mileage', "NEW.mileage < 0"),
+    ('location', """instr(NEW.location, ',') < 2
+                    OR substr(NEW.location, 1, instr(NEW.location, ',') - 1) GLOB '*[^0-9.-]*'
+                    OR substr(NEW.location, instr(NEW.location, ',') + 1) GLOB '*[^0-9.-]*'
+                    OR substr(NEW.location, instr(NEW.location, ',') + 1) = ''"""),
+)
+# Inserts check every column; updates only the columns whose value changes, so rows stored before
+# the rule existed (e.g. a free-text location) can still have their other fields updated
+_SCOOTER_INVALID_INSERT = ' OR '.join(f'({condition})' for _, condition in _SCOOTER_INVALID_COLUMNS)
+_SCOOTER_INVALID_UPDATE = ' OR '.join(f'(NEW.{column} IS NOT OLD.{column} AND ({condition}))'
+                                      for column, condition in _SCOOTER_INVALID_COLUMNS)
+_SCOOTER_INVALID_MESSAGE = 'scooter value out of range or invalid location'
 
 def init_db():
     """Initialize database with all required tables"""
+    global _scooter_fts
     with get_db() as conn:
         c = conn.cursor()
         
@@ -47,22 +133,73 @@ def init_db():
             registration_date TEXT NOT NULL
         )''')
         
-        # Scooters table with all required fields
+        # Scooters table with all required fields; numeric ranges are enforced by SQLite as well
         c.execute('''CREATE TABLE IF NOT EXISTS scooters (
             serial_number TEXT PRIMARY KEY,
             brand TEXT NOT NULL,
             model TEXT NOT NULL,
-            top_speed INTEGER NOT NULL,
-            battery_capacity INTEGER NOT NULL,
-            state_of_charge INTEGER NOT NULL,
+            top_speed INTEGER NOT NULL CHECK (top_speed > 0),
+            battery_capacity INTEGER NOT NULL CHECK (battery_capacity > 0),
+            state_of_charge INTEGER NOT NULL CHECK (state_of_charge BETWEEN 0 AND 100),
             target_range_soc TEXT NOT NULL,
             location TEXT NOT NULL,
             out_of_service_status INTEGER DEFAULT 0,
-            mileage REAL DEFAULT 0.0,
+            mileage REAL DEFAULT 0.0 CHECK (mileage >= 0),
             last_maintenance_date TEXT,
             in_service_date TEXT NOT NULL
         )''')
         
+        # The location text is the only source for coordinates; drop the unused numeric copy (and
+        # its index) that earlier versions kept. SQLite before 3.35 cannot drop columns, there the
+        # nullable leftovers stay behind unread
+        c.execute('DROP INDEX IF EXISTS idx_scooter_geo')
+        c.execute('PRAGMA table_info(scooters)')
+        if 'latitude' in {column[1] for column in c.fetchall()}:
+            try:
+                c.execute('ALTER TABLE scooters DROP COLUMN latitude')
+                c.execute('ALTER TABLE scooters DROP COLUMN longitude')
+            except sqlite3.OperationalError:
+                pass
+        
+        # Trigram full-text index over "brand model serial_number" for substring search, kept in
+        # sync by triggers; SQLite builds without FTS5 fall back to the LIKE scan in search_scooters.
+        # Rows are keyed on serial_number because VACUUM may renumber the implicit rowid of scooters
+        c.execute("SELECT 1 FROM sqlite_master WHERE name = 'scooter_fts' AND sql NOT LIKE '%serial_number%'")
+        if c.fetchone():
+            c.execute('DROP TABLE scooter_fts')  # Older index keyed on rowid, refilled below
+        try:
+            c.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS scooter_fts
+                         USING fts5(search_text, serial_number UNINDEXED, tokenize='trigram')''')
+            _scooter_fts = True
+        except sqlite3.OperationalError:
+            _scooter_fts = False
+        for trigger in ('scooter_fts_insert', 'scooter_fts_delete', 'scooter_fts_update'):
+            c.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        if _scooter_fts:
+            c.execute('''CREATE TRIGGER scooter_fts_insert AFTER INSERT ON scooters BEGIN
+                             INSERT INTO scooter_fts(search_text, serial_number)
+                             VALUES (NEW.brand || ' ' || NEW.model || ' ' || NEW.serial_number, NEW.serial_number);
+                         END''')
+            c.execute('''CREATE TRIGGER scooter_fts_delete AFTER DELETE ON scooters BEGIN
+                             DELETE FROM scooter_fts WHERE serial_number = OLD.serial_number;
+                         END''')
+            c.execute('''CREATE TRIGGER scooter_fts_update
+                         AFTER UPDATE OF brand, model, serial_number ON scooters BEGIN
+                             UPDATE scooter_fts
+                             SET search_text = NEW.brand || ' ' || NEW.model || ' ' || NEW.serial_number,
+                                 serial_number = NEW.serial_number
+                             WHERE serial_number = OLD.serial_number;
+                         END''')
+            # Refill the index unless it covers exactly the current scooters, e.g. for databases
+            # created (or restored) before it existed
+            c.execute('''SELECT (SELECT COUNT(*) FROM scooter_fts) = (SELECT COUNT(*) FROM scooters)
+                                AND NOT EXISTS (SELECT 1 FROM scooters
+                                                WHERE serial_number NOT IN (SELECT serial_number FROM scooter_fts))''')
+            if not c.fetchone()[0]:
+                c.execute('DELETE FROM scooter_fts')
+                c.execute('''INSERT INTO scooter_fts(search_text, serial_number)
+                             SELECT brand || ' ' || model || ' ' || serial_number, serial_number FROM scooters''')
+
         # Logs table
         c.execute('''CREATE TABLE IF NOT EXISTS logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -73,6 +210,31 @@ def init_db():
             suspicious INTEGER DEFAULT 0
         )''')
         
+        # Partial index holding only suspicious log entries, newest first, for the alert count and
+        # the ordered suspicious-log view; replaces the older unordered idx_logs_suspicious
+        c.execute('DROP INDEX IF EXISTS idx_logs_suspicious')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_logs_suspicious_recent
+                     ON logs(timestamp DESC, id DESC) WHERE suspicious = 1''')
+        
+        # Safety net for writes that skip the form validators, on inserts and updates alike: the same
+        # ranges as the CHECK constraints above (which only exist in databases created with them) and
+        # a location of two plain numbers separated by a comma. The triggers are recreated on every
+        # start so existing databases pick up changes to the rule
+        update_columns = ', '.join(column for column, _ in _SCOOTER_INVALID_COLUMNS)
+        for trigger, event, condition in (('validate_scooter_insert', 'INSERT', _SCOOTER_INVALID_INSERT),
+                                          ('validate_scooter_update', f'UPDATE OF {update_columns}',
+                                           _SCOOTER_INVALID_UPDATE)):
+            c.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+            c.execute(f'''CREATE TRIGGER {trigger}
+                          BEFORE {event} ON scooters
+                          WHEN {condition}
+                          BEGIN
+                              SELECT RAISE(ABORT, '{_SCOOTER_INVALID_MESSAGE}');
+                          END''')
+        
+        # Covering index for the per-city traveller histogram in get_statistics
+        c.execute('CREATE INDEX IF NOT EXISTS idx_travellers_city ON travellers(city)')
+        
         # Restore codes table
         c.execute('''CREATE TABLE IF NOT EXISTS restore_codes (
             code TEXT PRIMARY KEY,
@@ -84,25 +246,46 @@ def init_db():
         
         conn.commit()
 
-# Helper function to find user by username (handles both encrypted and unencrypted)
-def _find_user_row(username):
-    """Find user row by username (handles encryption)"""
+def _username_index():
+    """Map lower-cased usernames to their stored (encrypted) value, rebuilt after user writes"""
+    version = _table_versions['users']
+    cached = _read_cache.get('username_index')
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    index = {}
     with get_db() as conn:
         c = conn.cursor()
-        c.execute('SELECT username, password_hash, role, first_name, last_name, registration_date FROM users')
-        rows = c.fetchall()
-        
-        for row in rows:
+        c.execute('SELECT username FROM users')
+        for (stored_username,) in c:
             try:
-                # Try to decrypt the stored username
-                decrypted_username = decrypt_data(row[0])
-                if decrypted_username.lower() == username.lower():
-                    return row
+                decrypted_username = decrypt_data(stored_username)
             except:
                 # Handle legacy unencrypted data
-                if row[0].lower() == username.lower():
-                    return row
+                decrypted_username = stored_username
+            index[decrypted_username.lower()] = stored_username
+    _read_cache['username_index'] = (version, index)
+    return index
+
+# Helper function to find user by username (handles both encrypted and unencrypted)
+def _stored_username(username):
+    """Encrypted username as stored in the users table, or None if the user does not exist"""
+    # The index is rebuilt whenever the users table version changes, so a miss is final
+    return _username_index().get(username.lower())
+
+def _find_user_row(username):
+    """Find user row by username (handles encryption)"""
+    # Usernames are stored with non-deterministic encryption, so SQLite cannot match them; the
+    # decrypted index turns a lookup into a dict probe plus a primary key read
+    stored_username = _stored_username(username)
+    if stored_username is None:
         return None
+    
+    with get_db() as conn:
+        c = conn.cursor()
+        c.execute('SELECT username, password_hash, role, first_name, last_name, registration_date FROM users WHERE username=?',
+                  (stored_username,))
+        return c.fetchone()
 
 # ============================================================================
 # USER MANAGEMENT FUNCTIONS
@@ -146,6 +329,7 @@ def add_user(username, password_hash, role, first_name, last_name):
                         VALUES (?, ?, ?, ?, ?, ?)''',
                       (encrypted_username, password_hash, role, first_name, last_name, datetime.now().isoformat()))
             conn.commit()
+            _table_versions['users'] += 1
         return True
     except sqlite3.IntegrityError:
         return False
@@ -153,37 +337,65 @@ def add_user(username, password_hash, role, first_name, last_name):
         print(f"Error adding user: {e}")
         return False
 
+def _user_from_row(row):
+    """Build a user dict from (username, role, first_name, last_name, registration_date)"""
+    try:
+        decrypted_username = decrypt_data(row[0])
+        return {
+            'username': decrypted_username,
+            'role': row[1],
+            'first_name': row[2],
+            'last_name': row[3],
+            'registration_date': row[4]
+        }
+    except:
+        # Handle legacy unencrypted data
+        return {
+            'username': row[0],
+            'role': row[1],
+            'first_name': row[2],
+            'last_name': row[3],
+            'registration_date': row[4]
+        }
+
 def get_all_users():
-    """Get all users from database"""
+    """Get all users from database as read-only records; the result is cached until the next write to
+    the users table"""
+    version = _table_versions['users']
+    cached = _read_cache.get('users')
+    if cached and cached[0] == version:
+        return cached[1]
+    
     try:
         with get_db() as conn:
             c = conn.cursor()
             c.execute('SELECT username, role, first_name, last_name, registration_date FROM users')
-            rows = c.fetchall()
-            users = []
-            for row in rows:
-                try:
-                    decrypted_username = decrypt_data(row[0])
-                    users.append({
-                        'username': decrypted_username,
-                        'role': row[1],
-                        'first_name': row[2],
-                        'last_name': row[3],
-                        'registration_date': row[4]
-                    })
-                except:
-                    # Handle legacy unencrypted data
-                    users.append({
-                        'username': row[0],
-                        'role': row[1],
-                        'first_name': row[2],
-                        'last_name': row[3],
-                        'registration_date': row[4]
-                    })
-            return users
+            users = _frozen(_user_from_row(row) for row in c)
     except Exception as e:
         print(f"Error getting all users: {e}")
-        return []
+        return ()
+    _read_cache['users'] = (version, users)
+    return users
+
+def get_users_by_role(role):
+    """Get all users with the given role as read-only records; the role is filtered in SQL so only those
+    usernames are decrypted"""
+    version = _table_versions['users']
+    cache_key = ('users_by_role', role)
+    cached = _read_cache.get(cache_key)
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    try:
+        with get_db() as conn:
+            c = conn.cursor()
+            c.execute('SELECT username, role, first_name, last_name, registration_date FROM users WHERE role=?', (role,))
+            users = _frozen(_user_from_row(row) for row in c)
+    except Exception as e:
+        print(f"Error getting users by role: {e}")
+        return ()
+    _read_cache[cache_key] = (version, users)
+    return users
 
 def update_user(username, **kwargs):
     """Update user information - supports all fields including role"""
@@ -213,6 +425,7 @@ def update_user(username, **kwargs):
             query = f"UPDATE users SET {', '.join(update_fields)} WHERE username=?"
             c.execute(query, values)
             conn.commit()
+            _table_versions['users'] += 1
             return c.rowcount > 0
     except Exception as e:
         print(f"Error updating user: {e}")
@@ -232,24 +445,27 @@ def delete_user(username):
             c = conn.cursor()
             c.execute('DELETE FROM users WHERE username=?', (stored_username,))
             conn.commit()
+            _table_versions['users'] += 1
         return c.rowcount > 0
     except Exception as e:
         print(f"Error deleting user: {e}")
         return False
 
-def reset_user_password(username, new_password_hash):
-    """Reset user password"""
+def reset_user_password(username, new_password_hash, expected_password_hash=None):
+    """Reset user password; with expected_password_hash only if the stored hash still matches it"""
     try:
         # Find the actual stored username (encrypted or unencrypted)
-        row = _find_user_row(username)
-        if not row:
+        stored_username = _stored_username(username)
+        if stored_username is None:
             return False
-            
-        stored_username = row[0]  # Use the actual stored username
         
         with get_db() as conn:
             c = conn.cursor()
-            c.execute('UPDATE users SET password_hash=? WHERE username=?', (new_password_hash, stored_username))
+            if expected_password_hash is None:
+                c.execute('UPDATE users SET password_hash=? WHERE username=?', (new_password_hash, stored_username))
+            else:
+                c.execute('UPDATE users SET password_hash=? WHERE username=? AND password_hash=?',
+                          (new_password_hash, stored_username, expected_password_hash))
             conn.commit()
         return c.rowcount > 0
     except Exception as e:
@@ -284,11 +500,48 @@ def add_traveller(first_name, last_name, birthday, gender, street_name, house_nu
                        encrypted_house_number, zip_code, city, encrypted_email, encrypted_phone,
                        driving_license_number, datetime.now().isoformat()))
             conn.commit()
+            _table_versions['travellers'] += 1
         return customer_id
     except Exception as e:
         print(f"Error adding traveller: {e}")
         return None
 
+def _traveller_from_row(row):
+    """Build a traveller dict from a travellers row, decrypting the sensitive fields"""
+    try:
+        return {
+            'customer_id': row[0],
+            'first_name': row[1],
+            'last_name': row[2],
+            'birthday': row[3],
+            'gender': row[4],
+            'street_name': decrypt_data(row[5]),
+            'house_number': decrypt_data(row[6]),
+            'zip_code': row[7],
+            'city': row[8],
+            'email_address': decrypt_data(row[9]),
+            'mobile_phone': decrypt_data(row[10]),
+            'driving_license_number': row[11],
+            'registration_date': row[12]
+        }
+    except:
+        # Handle legacy unencrypted data
+        return {
+            'customer_id': row[0],
+            'first_name': row[1],
+            'last_name': row[2],
+            'birthday': row[3],
+            'gender': row[4],
+            'street_name': row[5],
+            'house_number': row[6],
+            'zip_code': row[7],
+            'city': row[8],
+            'email_address': row[9],
+            'mobile_phone': row[10],
+            'driving_license_number': row[11],
+            'registration_date': row[12]
+        }
+
 def get_traveller_by_id(customer_id):
     """Get a single traveller by customer_id"""
     try:
@@ -297,106 +550,66 @@ def get_traveller_by_id(customer_id):
             c.execute('SELECT * FROM travellers WHERE customer_id=?', (customer_id,))
             row = c.fetchone()
             if row:
-                try:
-                    return {
-                        'customer_id': row[0],
-                        'first_name': row[1],
-                        'last_name': row[2],
-                        'birthday': row[3],
-                        'gender': row[4],
-                        'street_name': decrypt_data(row[5]),
-                        'house_number': decrypt_data(row[6]),
-                        'zip_code': row[7],
-                        'city': row[8],
-                        'email_address': decrypt_data(row[9]),
-                        'mobile_phone': decrypt_data(row[10]),
-                        'driving_license_number': row[11],
-                        'registration_date': row[12]
-                    }
-                except:
-                    # Handle legacy unencrypted data
-                    return {
-                        'customer_id': row[0],
-                        'first_name': row[1],
-                        'last_name': row[2],
-                        'birthday': row[3],
-                        'gender': row[4],
-                        'street_name': row[5],
-                        'house_number': row[6],
-                        'zip_code': row[7],
-                        'city': row[8],
-                        'email_address': row[9],
-                        'mobile_phone': row[10],
-                        'driving_license_number': row[11],
-                        'registration_date': row[12]
-                    }
+                return _traveller_from_row(row)
     except Exception as e:
         print(f"Error getting traveller: {e}")
     return None
 
 def get_all_travellers():
-    """Get all travellers from database"""
+    """Get all travellers from database as read-only records; the result is cached until the next write to
+    the travellers table"""
+    version = _table_versions['travellers']
+    cached = _read_cache.get('travellers')
+    if cached and cached[0] == version:
+        return cached[1]
+    
     try:
         with get_db() as conn:
             c = conn.cursor()
             c.execute('SELECT * FROM travellers ORDER BY last_name, first_name')
-            rows = c.fetchall()
-            travellers = []
-            for row in rows:
-                try:
-                    travellers.append({
-                        'customer_id': row[0],
-                        'first_name': row[1],
-                        'last_name': row[2],
-                        'birthday': row[3],
-                        'gender': row[4],
-                        'street_name': decrypt_data(row[5]),
-                        'house_number': decrypt_data(row[6]),
-                        'zip_code': row[7],
-                        'city': row[8],
-                        'email_address': decrypt_data(row[9]),
-                        'mobile_phone': decrypt_data(row[10]),
-                        'driving_license_number': row[11],
-                        'registration_date': row[12]
-                    })
-                except:
-                    # Handle legacy unencrypted data
-                    travellers.append({
-                        'customer_id': row[0],
-                        'first_name': row[1],
-                        'last_name': row[2],
-                        'birthday': row[3],
-                        'gender': row[4],
-                        'street_name': row[5],
-                        'house_number': row[6],
-                        'zip_code': row[7],
-                        'city': row[8],
-                        'email_address': row[9],
-                        'mobile_phone': row[10],
-                        'driving_license_number': row[11],
-                        'registration_date': row[12]
-                    })
-            return travellers
+            travellers = _frozen(_traveller_from_row(row) for row in c)
     except Exception as e:
         print(f"Error getting all travellers: {e}")
-        return []
+        return ()
+    _read_cache['travellers'] = (version, travellers)
+    return travellers
+
+def _like_pattern(search_term):
+    """Build a LIKE pattern matching search_term anywhere, with wildcards escaped"""
+    escaped = search_term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
 
 def search_travellers(search_term):
     """Search travellers by multiple criteria"""
+    cached = _cached_search('travellers', search_term)
+    if cached is not None:
+        return cached
+    
+    version = _table_versions['travellers']
     try:
-        travellers = get_all_travellers()
         results = []
         search_lower = search_term.lower()
         
-        for traveller in travellers:
-            # Search in multiple fields
-            searchable_text = f"{traveller['first_name']} {traveller['last_name']} {traveller['customer_id']} {traveller['email_address']}".lower()
-            if search_lower in searchable_text:
-                results.append(traveller)
-        return results
+        with get_db() as conn:
+            c = conn.cursor()
+            # Plaintext columns are matched by SQLite; the encrypted email can only be checked after decrypting
+            c.execute(r"""SELECT *, (first_name || ' ' || last_name || ' ' || customer_id) LIKE ? ESCAPE '\'
+                          FROM travellers ORDER BY last_name, first_name""", (_like_pattern(search_term),))
+            for row in c:
+                if not row[-1]:
+                    # Only the email is decrypted to test the row; the full record is decrypted for matches only
+                    try:
+                        email = decrypt_data(row[9])
+                    except:
+                        email = row[9]
+                    searchable_text = f"{row[1]} {row[2]} {row[0]} {email}".lower()
+                    if search_lower not in searchable_text:
+                        continue
+                results.append(_traveller_from_row(row[:-1]))
+        return _store_search('travellers', search_term, version, results)
     except Exception as e:
         print(f"Error searching travellers: {e}")
-        return []
+        return ()
 
 def update_traveller(customer_id, **kwargs):
     """Update traveller information"""
@@ -418,6 +631,7 @@ def update_traveller(customer_id, **kwargs):
             query = f"UPDATE travellers SET {', '.join(update_fields)} WHERE customer_id=?"
             c.execute(query, values)
             conn.commit()
+            _table_versions['travellers'] += 1
             
             # Check if any rows were affected
             return c.rowcount > 0
@@ -432,6 +646,7 @@ def delete_traveller(customer_id):
             c = conn.cursor()
             c.execute('DELETE FROM travellers WHERE customer_id=?', (customer_id,))
             conn.commit()
+            _table_versions['travellers'] += 1
             
             # Check if any rows were affected
             return c.rowcount > 0
@@ -443,29 +658,65 @@ def delete_traveller(customer_id):
 # SCOOTER MANAGEMENT FUNCTIONS
 # ============================================================================
 
+# Named parameters, so a scooter is passed around as one dict of fields and every add reuses the
+# same cached statement
+_SCOOTER_INSERT_SQL = '''INSERT INTO scooters 
+    (serial_number, brand, model, top_speed, battery_capacity, 
+     state_of_charge, target_range_soc, location, last_maintenance_date, 
+     out_of_service_status, mileage, in_service_date) 
+    VALUES (:serial_number, :brand, :model, :top_speed, :battery_capacity,
+            :state_of_charge, :target_range_soc, :location, :last_maintenance_date,
+            :out_of_service_status, :mileage, :in_service_date)'''
+
+def _scooter_insert_params(scooter, in_service_date):
+    """Named parameters for _SCOOTER_INSERT_SQL; optional fields default as in add_scooter"""
+    return {'last_maintenance_date': None, 'out_of_service_status': 0, 'mileage': 0.0, **scooter,
+            'in_service_date': in_service_date}
+
 def add_scooter(brand, model, serial_number, top_speed, battery_capacity, 
                state_of_charge, target_range_soc, location, last_maintenance_date=None,
                out_of_service_status=0, mileage=0.0):
     """Add a new scooter to the database"""
+    scooter = {
+        'serial_number': serial_number, 'brand': brand, 'model': model,
+        'top_speed': top_speed, 'battery_capacity': battery_capacity,
+        'state_of_charge': state_of_charge, 'target_range_soc': target_range_soc,
+        'location': location, 'last_maintenance_date': last_maintenance_date,
+        'out_of_service_status': out_of_service_status, 'mileage': mileage
+    }
     try:
         with get_db() as conn:
             c = conn.cursor()
-            c.execute('''INSERT INTO scooters 
-                        (serial_number, brand, model, top_speed, battery_capacity, 
-                         state_of_charge, target_range_soc, location, last_maintenance_date, 
-                         out_of_service_status, mileage, in_service_date) 
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                      (serial_number, brand, model, top_speed, battery_capacity, state_of_charge,
-                       target_range_soc, location, last_maintenance_date, out_of_service_status, 
-                       mileage, datetime.now().isoformat()))
+            c.execute(_SCOOTER_INSERT_SQL, _scooter_insert_params(scooter, datetime.now().isoformat()))
             conn.commit()
+            _table_versions['scooters'] += 1
         return True
-    except sqlite3.IntegrityError:
-        return False  # Serial number already exists
+    except sqlite3.IntegrityError as e:
+        if 'UNIQUE' in str(e):
+            return False  # Serial number already exists
+        print(f"Error adding scooter: {e}")
+        return False
     except Exception as e:
         print(f"Error adding scooter: {e}")
         return False
 
+def _scooter_from_row(row):
+    """Build a scooter dict from a scooters row"""
+    return {
+        'serial_number': row[0],
+        'brand': row[1],
+        'model': row[2],
+        'top_speed': row[3],
+        'battery_capacity': row[4],
+        'state_of_charge': row[5],
+        'target_range_soc': row[6],
+        'location': row[7],
+        'out_of_service_status': row[8],
+        'mileage': row[9],
+        'last_maintenance_date': row[10],
+        'in_service_date': row[11]
+    }
+
 def get_scooter_by_serial(serial_number):
     """Get a single scooter by serial number"""
     try:
@@ -474,97 +725,112 @@ def get_scooter_by_serial(serial_number):
             c.execute('SELECT * FROM scooters WHERE serial_number=?', (serial_number,))
             row = c.fetchone()
             if row:
-                return {
-                    'serial_number': row[0],
-                    'brand': row[1],
-                    'model': row[2],
-                    'top_speed': row[3],
-                    'battery_capacity': row[4],
-                    'state_of_charge': row[5],
-                    'target_range_soc': row[6],
-                    'location': row[7],
-                    'out_of_service_status': row[8],
-                    'mileage': row[9],
-                    'last_maintenance_date': row[10],
-                    'in_service_date': row[11]
-                }
+                return _scooter_from_row(row)
     except Exception as e:
         print(f"Error getting scooter: {e}")
     return None
 
 def get_all_scooters():
-    """Get all scooters from database"""
+    """Get all scooters from database as read-only records; the result is cached until the next write to
+    the scooters table"""
+    version = _table_versions['scooters']
+    cached = _read_cache.get('scooters')
+    if cached and cached[0] == version:
+        return cached[1]
+    
     try:
         with get_db() as conn:
             c = conn.cursor()
             c.execute('SELECT * FROM scooters ORDER BY brand, model, serial_number')
-            rows = c.fetchall()
-            scooters = []
-            for row in rows:
-                scooters.append({
-                    'serial_number': row[0],
-                    'brand': row[1],
-                    'model': row[2],
-                    'top_speed': row[3],
-                    'battery_capacity': row[4],
-                    'state_of_charge': row[5],
-                    'target_range_soc': row[6],
-                    'location': row[7],
-                    'out_of_service_status': row[8],
-                    'mileage': row[9],
-                    'last_maintenance_date': row[10],
-                    'in_service_date': row[11]
-                })
-            return scooters
+            scooters = _frozen(_scooter_from_row(row) for row in c)
     except Exception as e:
         print(f"Error getting all scooters: {e}")
-        return []
+        return ()
+    _read_cache['scooters'] = (version, scooters)
+    return scooters
+
+def get_scooter_stats():
+    """Return (total, in service, average battery) for the fleet, computed by SQLite"""
+    version = _table_versions['scooters']
+    cached = _read_cache.get('scooter_stats')
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    try:
+        with get_db() as conn:
+            c = conn.cursor()
+            c.execute('''SELECT COUNT(*),
+                                SUM(CASE WHEN out_of_service_status THEN 0 ELSE 1 END),
+                                AVG(state_of_charge)
+                         FROM scooters''')
+            total, in_service, avg_battery = c.fetchone()
+    except Exception as e:
+        print(f"Error getting scooter statistics: {e}")
+        return (0, 0, 0.0)
+    stats = (total, in_service or 0, avg_battery or 0.0)
+    _read_cache['scooter_stats'] = (version, stats)
+    return stats
 
 def search_scooters(search_term):
     """Search scooters by multiple criteria"""
+    cached = _cached_search('scooters', search_term)
+    if cached is not None:
+        return cached
+    
+    version = _table_versions['scooters']
     try:
-        scooters = get_all_scooters()
-        results = []
-        search_lower = search_term.lower()
-        
-        for scooter in scooters:
-            searchable_text = f"{scooter['brand']} {scooter['model']} {scooter['serial_number']}".lower()
-            if search_lower in searchable_text:
-                results.append(scooter)
-        return results
+        with get_db() as conn:
+            c = conn.cursor()
+            if _scooter_fts and len(search_term) >= 3:
+                # Trigram lookups need at least three characters; the quoted phrase matches anywhere
+                c.execute("""SELECT * FROM scooters
+                             WHERE serial_number IN (SELECT serial_number FROM scooter_fts WHERE scooter_fts MATCH ?)
+                             ORDER BY brand, model, serial_number""",
+                          ('"' + search_term.replace('"', '""') + '"',))
+            else:
+                c.execute(r"""SELECT * FROM scooters
+                              WHERE (brand || ' ' || model || ' ' || serial_number) LIKE ? ESCAPE '\'
+                              ORDER BY brand, model, serial_number""", (_like_pattern(search_term),))
+            results = [_scooter_from_row(row) for row in c]
+        return _store_search('scooters', search_term, version, results)
     except Exception as e:
         print(f"Error searching scooters: {e}")
-        return []
+        return ()
+
+# Scooter fields each role may update
+_SERVICE_ENGINEER_SCOOTER_FIELDS = frozenset({'state_of_charge', 'location', 'out_of_service_status',
+                                              'mileage', 'last_maintenance_date'})
+_ADMIN_SCOOTER_FIELDS = _SERVICE_ENGINEER_SCOOTER_FIELDS | {'brand', 'model', 'top_speed',
+                                                            'battery_capacity', 'target_range_soc'}
+SCOOTER_FIELDS_BY_ROLE = {
+    'service_engineer': _SERVICE_ENGINEER_SCOOTER_FIELDS,
+    'system_admin': _ADMIN_SCOOTER_FIELDS,
+    'super_admin': _ADMIN_SCOOTER_FIELDS,
+}
+
+@lru_cache(maxsize=64)
+def _scooter_update_sql(fields):
+    """UPDATE statement for a sorted tuple of scooter columns, built once per column set"""
+    return f"UPDATE scooters SET {', '.join(f'{field}=?' for field in fields)} WHERE serial_number=?"
 
 def update_scooter(serial_number, user_role, **kwargs):
     """Update scooter information based on user role permissions"""
-    # Define which fields each role can update
-    service_engineer_fields = ['state_of_charge', 'location', 'out_of_service_status', 'mileage', 'last_maintenance_date']
-    admin_fields = service_engineer_fields + ['brand', 'model', 'top_speed', 'battery_capacity', 'target_range_soc']
+    allowed_fields = SCOOTER_FIELDS_BY_ROLE.get(user_role)
+    
+    # Check role permissions
+    updates = {field: value for field, value in kwargs.items()
+               if allowed_fields is None or field in allowed_fields}
+    if not updates:
+        return False
     
+    # Sorted so every order of the same fields maps to one statement text (and one cached statement)
+    fields = tuple(sorted(updates))
     try:
         with get_db() as conn:
             c = conn.cursor()
-            update_fields = []
-            values = []
-            
-            for field, value in kwargs.items():
-                # Check role permissions
-                if user_role == 'service_engineer' and field not in service_engineer_fields:
-                    continue
-                elif user_role in ['system_admin', 'super_admin'] and field not in admin_fields:
-                    continue
-                
-                values.append(value)
-                update_fields.append(f"{field}=?")
-            
-            if not update_fields:
-                return False
-                
-            values.append(serial_number)
-            query = f"UPDATE scooters SET {', '.join(update_fields)} WHERE serial_number=?"
-            c.execute(query, values)
+            c.execute(_scooter_update_sql(fields), [*(updates[field] for field in fields), serial_number])
             conn.commit()
+            _table_versions['scooters'] += 1
             
             # Check if any rows were affected
             return c.rowcount > 0
@@ -579,6 +845,7 @@ def delete_scooter(serial_number):
             c = conn.cursor()
             c.execute('DELETE FROM scooters WHERE serial_number=?', (serial_number,))
             conn.commit()
+            _table_versions['scooters'] += 1
             
             # Check if any rows were affected
             return c.rowcount > 0
@@ -604,6 +871,21 @@ def add_restore_code(code, system_admin_username, backup_name):
         print(f"Error adding restore code: {e}")
         return False
 
+def add_restore_codes_bulk(rows):
+    """Add several (code, system_admin_username, backup_name) restore codes in one transaction"""
+    try:
+        created = datetime.now().isoformat()
+        with get_db() as conn:
+            c = conn.cursor()
+            c.executemany('''INSERT INTO restore_codes (code, system_admin_username, backup_name, created_date) 
+                            VALUES (?, ?, ?, ?)''',
+                          [(code, admin, backup, created) for code, admin, backup in rows])
+            conn.commit()
+        return True
+    except Exception as e:
+        print(f"Error adding restore codes: {e}")
+        return False
+
 def get_restore_code(code):
     """Get restore code information"""
     try:
@@ -651,80 +933,174 @@ def revoke_restore_code(code):
 # LOGGING FUNCTIONS
 # ============================================================================
 
+# Log events are written by a background thread so callers don't wait on the insert + commit
+# Each queued item is a tuple of one or more log rows that belong together
+_log_queue = queue.Queue()
+_log_writer_started = False
+_log_writer_lock = threading.Lock()
+
+def _log_worker():
+    """Write queued log events to the database, one transaction per batch"""
+    while True:
+        batch = [_log_queue.get()]
+        while True:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            rows = [(timestamp, username, encrypt_data(description),
+                     encrypt_data(additional_info) if additional_info else "", suspicious)
+                    for events in batch
+                    for timestamp, username, description, additional_info, suspicious in events]
+            with get_db() as conn:
+                c = conn.cursor()
+                c.executemany('''INSERT INTO logs (timestamp, username, description, additional_info, suspicious) 
+                                VALUES (?, ?, ?, ?, ?)''', rows)
+                conn.commit()
+        except Exception as e:
+            print(f"Error logging event: {e}")
+        finally:
+            for _ in batch:
+                _log_queue.task_done()
+
+def _start_log_writer():
+    """Start the background log writer on first use"""
+    global _log_writer_started
+    with _log_writer_lock:
+        if not _log_writer_started:
+            threading.Thread(target=_log_worker, name="log-writer", daemon=True).start()
+            atexit.register(flush_logs)
+            _log_writer_started = True
+
+def flush_logs():
+    """Block until every queued log event has been written"""
+    if _log_writer_started:
+        _log_queue.join()
+
 def log_event(description, username="", additional_info="", suspicious=False):
     """Log an event to the database"""
+    global _suspicious_log_version
     try:
-        with get_db() as conn:
-            c = conn.cursor()
-            encrypted_description = encrypt_data(description)
-            encrypted_additional = encrypt_data(additional_info) if additional_info else ""
-            c.execute('''INSERT INTO logs (timestamp, username, description, additional_info, suspicious) 
-                        VALUES (?, ?, ?, ?, ?)''',
-                      (datetime.now().isoformat(), username, encrypted_description, 
-                       encrypted_additional, 1 if suspicious else 0))
-            conn.commit()
+        _start_log_writer()
+        _log_queue.put(((datetime.now().isoformat(), username, description,
+                         additional_info, 1 if suspicious else 0),))
+        if suspicious:
+            _suspicious_log_version += 1
     except Exception as e:
         print(f"Error logging event: {e}")
 
+def log_events_bulk(events):
+    """Log several (description, username, additional_info, suspicious) events, written in one transaction"""
+    global _suspicious_log_version
+    try:
+        timestamp = datetime.now().isoformat()
+        rows = tuple((timestamp, username, description, additional_info, 1 if suspicious else 0)
+                     for description, username, additional_info, suspicious in events)
+        if not rows:
+            return
+        _start_log_writer()
+        _log_queue.put(rows)
+        if any(row[4] for row in rows):
+            _suspicious_log_version += 1
+    except Exception as e:
+        print(f"Error logging events: {e}")
+
+def _log_from_row(row):
+    """Build a log dict from a logs row, decrypting description and extra info"""
+    try:
+        return {
+            'id': row[0],
+            'timestamp': row[1],
+            'username': row[2],
+            'description': decrypt_data(row[3]),
+            'additional_info': decrypt_data(row[4]) if row[4] else "",
+            'suspicious': bool(row[5])
+        }
+    except:
+        # Handle legacy unencrypted logs
+        return {
+            'id': row[0],
+            'timestamp': row[1],
+            'username': row[2],
+            'description': row[3],
+            'additional_info': row[4] if row[4] else "",
+            'suspicious': bool(row[5])
+        }
+
 def get_logs():
     """Get all logs from database"""
+    flush_logs()
     try:
         with get_db() as conn:
             c = conn.cursor()
-            c.execute('SELECT * FROM logs ORDER BY timestamp DESC')
-            rows = c.fetchall()
-            logs = []
-            for row in rows:
-                try:
-                    logs.append({
-                        'id': row[0],
-                        'timestamp': row[1],
-                        'username': row[2],
-                        'description': decrypt_data(row[3]),
-                        'additional_info': decrypt_data(row[4]) if row[4] else "",
-                        'suspicious': bool(row[5])
-                    })
-                except:
-                    # Handle legacy unencrypted logs
-                    logs.append({
-                        'id': row[0],
-                        'timestamp': row[1],
-                        'username': row[2],
-                        'description': row[3],
-                        'additional_info': row[4] if row[4] else "",
-                        'suspicious': bool(row[5])
-                    })
-            return logs
+            c.execute('SELECT * FROM logs ORDER BY timestamp DESC, id DESC')
+            return [_log_from_row(row) for row in c]
     except Exception as e:
         print(f"Error getting logs: {e}")
         return []
 
+def get_log_page(offset, limit):
+    """Get one page of logs, newest first; only the requested rows are read and decrypted"""
+    flush_logs()
+    try:
+        with get_db() as conn:
+            c = conn.cursor()
+            c.execute('SELECT * FROM logs ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?', (limit, offset))
+            return [_log_from_row(row) for row in c]
+    except Exception as e:
+        print(f"Error getting logs: {e}")
+        return []
+
+def get_log_counts():
+    """Get (total, suspicious) number of log entries"""
+    flush_logs()
+    try:
+        with get_db() as conn:
+            c = conn.cursor()
+            c.execute('SELECT COUNT(*) FROM logs')
+            total = c.fetchone()[0]
+            c.execute('SELECT COUNT(*) FROM logs WHERE suspicious = 1')
+            return (total, c.fetchone()[0])
+    except Exception as e:
+        print(f"Error counting logs: {e}")
+        return (0, 0)
+
 def get_suspicious_logs():
     """Get only suspicious logs"""
+    flush_logs()
     try:
-        logs = get_logs()
-        return [log for log in logs if log['suspicious']]
+        with get_db() as conn:
+            c = conn.cursor()
+            c.execute('SELECT * FROM logs WHERE suspicious = 1 ORDER BY timestamp DESC, id DESC')
+            return [_log_from_row(row) for row in c]
     except Exception as e:
         print(f"Error getting suspicious logs: {e}")
         return []
 
+def get_suspicious_log_version():
+    """Get counter that changes whenever a new suspicious event is logged"""
+    return _suspicious_log_version
+
 def get_logs_summary():
-    """Get summary statistics of logs"""
+    """Get summary statistics of logs, counted by SQLite so no log row is decrypted"""
+    flush_logs()
     try:
-        logs = get_logs()
-        total_logs = len(logs)
-        suspicious_count = len([log for log in logs if log['suspicious']])
+        # Get last 24 hours activity; ISO timestamps compare correctly as strings
+        from datetime import timedelta
+        yesterday = (datetime.now() - timedelta(days=1)).isoformat()
         
-        # Get last 24 hours activity
-        from datetime import datetime, timedelta
-        yesterday = datetime.now() - timedelta(days=1)
-        recent_logs = [log for log in logs if datetime.fromisoformat(log['timestamp']) > yesterday]
+        with get_db() as conn:
+            c = conn.cursor()
+            c.execute('''SELECT COUNT(*), SUM(suspicious = 1), SUM(timestamp > ?), MAX(timestamp)
+                         FROM logs''', (yesterday,))
+            total_logs, suspicious_count, recent_logs, last_activity = c.fetchone()
         
         return {
             'total_logs': total_logs,
-            'suspicious_count': suspicious_count,
-            'recent_logs': len(recent_logs),
-            'last_activity': logs[0]['timestamp'] if logs else None
+            'suspicious_count': suspicious_count or 0,
+            'recent_logs': recent_logs or 0,
+            'last_activity': last_activity
         }
     except Exception as e:
         print(f"Error getting logs summary: {e}")
@@ -741,6 +1117,7 @@ def get_logs_summary():
 
 def get_database_stats():
     """Get database statistics"""
+    flush_logs()
     try:
         with get_db() as conn:
             c = conn.cursor()
@@ -778,6 +1155,52 @@ def get_database_stats():
             'active_restore_codes': 0
         }
 
+def get_statistics():
+    """Get counts and aggregates for the statistics screen, computed by SQLite"""
+    try:
+        with get_db() as conn:
+            c = conn.cursor()
+            
+            c.execute('SELECT COUNT(*) FROM users')
+            user_count = c.fetchone()[0]
+            
+            c.execute('SELECT COUNT(*) FROM travellers')
+            traveller_count = c.fetchone()[0]
+            
+            c.execute('''SELECT COUNT(*),
+                                SUM(CASE WHEN out_of_service_status THEN 0 ELSE 1 END),
+                                AVG(state_of_charge),
+                                SUM(mileage),
+                                SUM(CASE WHEN state_of_charge < 20 THEN 1 ELSE 0 END),
+                                SUM(CASE WHEN state_of_charge >= 20 AND state_of_charge < 80 THEN 1 ELSE 0 END),
+                                SUM(CASE WHEN state_of_charge >= 80 THEN 1 ELSE 0 END)
+                         FROM scooters''')
+            (scooter_count, in_service, avg_battery, total_mileage,
+             low_battery, medium_battery, high_battery) = c.fetchone()
+            
+            c.execute('SELECT city, COUNT(*) FROM travellers GROUP BY city ORDER BY COUNT(*) DESC, city')
+            cities = c.fetchall()
+            
+            c.execute('SELECT role, COUNT(*) FROM users GROUP BY role')
+            roles = c.fetchall()
+            
+            return {
+                'users': user_count,
+                'travellers': traveller_count,
+                'scooters': scooter_count,
+                'in_service': in_service or 0,
+                'avg_battery': avg_battery or 0.0,
+                'total_mileage': total_mileage or 0.0,
+                'low_battery': low_battery or 0,
+                'medium_battery': medium_battery or 0,
+                'high_battery': high_battery or 0,
+                'cities': cities,
+                'roles': roles
+            }
+    except Exception as e:
+        print(f"Error getting statistics: {e}")
+        return None
+
 def cleanup_old_logs(days_to_keep=90):
     """Clean up old log entries (older than specified days)"""
     try:
@@ -785,6 +1208,7 @@ def cleanup_old_logs(days_to_keep=90):
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
         cutoff_iso = cutoff_date.isoformat()
         
+        flush_logs()
         with get_db() as conn:
             c = conn.cursor()
             c.execute('DELETE FROM logs WHERE timestamp < ? AND suspicious = 0', (cutoff_iso,))
@@ -800,6 +1224,7 @@ def backup_database(backup_path):
     """Create a backup copy of the database"""
     try:
         import shutil
+        flush_logs()
         shutil.copy2(DB_PATH, backup_path)
         return True
     except Exception as e:
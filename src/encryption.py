@@ -398,7 +398,3 @@ def secure_delete_file(file_path: str) -> bool:
     except Exception as e:
         print(f"Veilig bestand verwijderen mislukt: {e}")
         return False
-
-# Test encryption on import
-if not validate_encryption_setup():
-    print("⚠️ WAARSCHUWING: Encryptie validatie mislukt! Systeem is mogelijk niet veilig.")
\ No newline at end of file
@@ -1,5 +1,32 @@
 import re
 from datetime import datetime
+from functools import lru_cache
+
+# Special characters allowed in passwords, as a bitmap indexed by ASCII code
+PASSWORD_SPECIAL_CHARS = "~!@#$%&_-+=`|\\(){}[]:;'<>,.?/"
+_SPECIAL_BITMAP = sum(1 << ord(c) for c in set(PASSWORD_SPECIAL_CHARS))
+
+# Accepted spellings for gender input and for going back to the previous menu
+_GENDER_VALUES = frozenset({'male', 'female', 'm', 'f', 'man', 'vrouw'})
+_BACK_COMMANDS = frozenset({'terug', 'back', 'b', 't', 'exit', 'quit'})
+
+# Username: starts with a letter or underscore, 8-10 characters in total
+_USERNAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_'.]{7,9}")
+
+# Patterns for the traveller form, compiled once at import
+_ZIP_CODE_RE = re.compile(r'[1-9][0-9]{3}[A-Z]{2}')
+_MOBILE_PHONE_RE = re.compile(r'[0-9]{8}')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NAME_RE = re.compile(r"[A-Za-z\s'\-]{1,50}")
+_STREET_NAME_RE = re.compile(r"[A-Za-z0-9\s.\-']{1,100}")
+_DRIVING_LICENSE_RE = re.compile(r'[A-Z]{2}[0-9]{7}|[A-Z][0-9]{8}')  # XXDDDDDDD or XDDDDDDDD
+
+# Patterns for the scooter form and search boxes, compiled once at import
+_SERIAL_NUMBER_RE = re.compile(r'[A-Za-z0-9]{10,17}')
+_GPS_NUMBER_RE = re.compile(r'-?[0-9]+(\.[0-9]+)?')  # Plain decimal, as stored in 'lat,lon'
+_BRAND_MODEL_RE = re.compile(r"[A-Za-z0-9\s\-_.]{1,50}")
+_SEARCH_TERM_RE = re.compile(r"[A-Za-z0-9\s@.\-_']{1,100}")
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
 
 def validate_username(username: str) -> bool:
     """
@@ -12,15 +39,8 @@ def validate_username(username: str) -> bool:
     if not username or len(username) < 8 or len(username) > 10:
         return False
     
-    # Must start with letter or underscore
-    if not re.match(r'^[A-Za-z_]', username):
-        return False
-    
-    # Can only contain allowed characters
-    if not re.fullmatch(r"[A-Za-z0-9_'.]{8,10}", username):
-        return False
-    
-    return True
+    # Must start with letter or underscore and only contain allowed characters
+    return bool(_USERNAME_RE.fullmatch(username))
 
 def validate_password(password: str) -> bool:
     """
@@ -34,41 +54,47 @@ def validate_password(password: str) -> bool:
     if not password or len(password) < 12 or len(password) > 30:
         return False
     
-    # Check for required character types
-    has_lower = bool(re.search(r'[a-z]', password))
-    has_upper = bool(re.search(r'[A-Z]', password))
-    has_digit = bool(re.search(r'\d', password))
-    has_special = bool(re.search(r'[~!@#$%&_\-+=`|\\(){}[\]:;\'<>,.?/]', password))
+    # Single pass over the password, one bit per required character type
+    mask = 0
+    for c in password:
+        code = ord(c)
+        if 97 <= code <= 122:  # a-z
+            mask |= 1
+        elif 65 <= code <= 90:  # A-Z
+            mask |= 2
+        elif c.isdecimal():
+            mask |= 4
+        elif code < 128 and (_SPECIAL_BITMAP >> code) & 1:
+            mask |= 8
+        if mask == 15:
+            return True
     
-    return has_lower and has_upper and has_digit and has_special
+    return False
 
 def validate_zip_code(zipcode: str) -> bool:
     """
     Validate Dutch zip code format: DDDDXX (4 digits + 2 uppercase letters)
     """
-    return bool(re.fullmatch(r'[1-9][0-9]{3}[A-Z]{2}', zipcode))
+    return bool(_ZIP_CODE_RE.fullmatch(zipcode))
 
 def validate_mobile_phone(phone: str) -> bool:
     """
     Validate mobile phone format: DDDDDDDD (8 digits)
     Note: +31-6- prefix is added automatically
     """
-    return bool(re.fullmatch(r'[0-9]{8}', phone))
+    return bool(_MOBILE_PHONE_RE.fullmatch(phone))
 
 def validate_driving_license(license_number: str) -> bool:
     """
     Validate driving license format: XXDDDDDDD or XDDDDDDDD
     """
-    pattern1 = r'[A-Z]{2}[0-9]{7}'  # XXDDDDDDD
-    pattern2 = r'[A-Z][0-9]{8}'     # XDDDDDDDD
-    return bool(re.fullmatch(pattern1, license_number) or re.fullmatch(pattern2, license_number))
+    return bool(_DRIVING_LICENSE_RE.fullmatch(license_number))
 
 def validate_email(email: str) -> bool:
     """
     Validate email format
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.fullmatch(pattern, email))
+    return bool(_EMAIL_RE.fullmatch(email))
 
 def validate_gps_coordinates(latitude: str, longitude: str) -> bool:
     """
@@ -113,13 +139,19 @@ def validate_flexible_gps_coordinate(coord_str: str, coord_type: str) -> bool:
     except ValueError:
         return False
 
+def validate_gps_number(coord_str: str) -> bool:
+    """
+    Validate that a GPS coordinate is a plain decimal number (no exponent or spaces)
+    """
+    return bool(coord_str and _GPS_NUMBER_RE.fullmatch(coord_str))
+
 def validate_serial_number(serial: str) -> bool:
     """
     Validate scooter serial number: 10-17 alphanumeric characters
     """
     if not serial or len(serial) < 10 or len(serial) > 17:
         return False
-    return bool(re.fullmatch(r'[A-Za-z0-9]{10,17}', serial))
+    return bool(_SERIAL_NUMBER_RE.fullmatch(serial))
 
 def validate_date_iso(date_str: str) -> bool:
     """
@@ -141,40 +173,48 @@ def validate_date_dutch(date_str: str) -> bool:
     except ValueError:
         return False
 
-def validate_flexible_date(date_str: str) -> bool:
+# Accepted day-month-year spellings for flexible dates, tried in this order
+_FLEXIBLE_DATE_FORMATS = (
+    '%d-%m-%Y',   # 15-03-2024
+    '%d/%m/%Y',   # 15/03/2024
+    '%d.%m.%Y',   # 15.03.2024
+    '%d-%m-%y',   # 15-03-24
+    '%d/%m/%y',   # 15/03/24
+    '%d.%m.%y',   # 15.03.24
+    '%d %m %Y',   # 15 03 2024
+    '%d %m %y',   # 15 03 24
+)
+
+@lru_cache(maxsize=64)
+def parse_flexible_date(date_str: str):
     """
-    Validate date in multiple flexible formats
-    Accepts: DD-MM-YYYY, DD/MM/YYYY, DD.MM.YYYY, DD-MM-YY, DD/MM/YY, DD.MM.YY
+    Parse a date in one of the flexible formats, returns None if none match
+    Validating and then converting the same input only parses it once
     """
     if not date_str:
-        return False
+        return None
     
-    # Try different date formats
-    formats = [
-        '%d-%m-%Y',   # 15-03-2024
-        '%d/%m/%Y',   # 15/03/2024
-        '%d.%m.%Y',   # 15.03.2024
-        '%d-%m-%y',   # 15-03-24
-        '%d/%m/%y',   # 15/03/24
-        '%d.%m.%y',   # 15.03.24
-        '%d %m %Y',   # 15 03 2024
-        '%d %m %y',   # 15 03 24
-    ]
-    
-    for fmt in formats:
+    for fmt in _FLEXIBLE_DATE_FORMATS:
         try:
             parsed_date = datetime.strptime(date_str, fmt)
-            # Convert 2-digit years to 4-digit (assume 20xx for years 00-30, 19xx for 31-99)
-            if parsed_date.year < 100:
-                if parsed_date.year <= 30:
-                    parsed_date = parsed_date.replace(year=parsed_date.year + 2000)
-                else:
-                    parsed_date = parsed_date.replace(year=parsed_date.year + 1900)
-            return True
         except ValueError:
             continue
+        # Convert 2-digit years to 4-digit (assume 20xx for years 00-30, 19xx for 31-99)
+        if parsed_date.year < 100:
+            if parsed_date.year <= 30:
+                parsed_date = parsed_date.replace(year=parsed_date.year + 2000)
+            else:
+                parsed_date = parsed_date.replace(year=parsed_date.year + 1900)
+        return parsed_date
     
-    return False
+    return None
+
+def validate_flexible_date(date_str: str) -> bool:
+    """
+    Validate date in multiple flexible formats
+    Accepts: DD-MM-YYYY, DD/MM/YYYY, DD.MM.YYYY, DD-MM-YY, DD/MM/YY, DD.MM.YY
+    """
+    return parse_flexible_date(date_str) is not None
 
 def convert_dutch_to_iso(dutch_date: str) -> str:
     """
@@ -200,28 +240,10 @@ def convert_flexible_date_to_iso(date_str: str) -> str:
     """
     Convert flexible date format to ISO format (YYYY-MM-DD)
     """
-    if not date_str:
+    parsed_date = parse_flexible_date(date_str)
+    if parsed_date is None:
         return ""
-    
-    formats = [
-        '%d-%m-%Y', '%d/%m/%Y', '%d.%m.%Y', '%d-%m-%y', 
-        '%d/%m/%y', '%d.%m.%y', '%d %m %Y', '%d %m %y'
-    ]
-    
-    for fmt in formats:
-        try:
-            parsed_date = datetime.strptime(date_str, fmt)
-            # Convert 2-digit years
-            if parsed_date.year < 100:
-                if parsed_date.year <= 30:
-                    parsed_date = parsed_date.replace(year=parsed_date.year + 2000)
-                else:
-                    parsed_date = parsed_date.replace(year=parsed_date.year + 1900)
-            return parsed_date.strftime('%Y-%m-%d')
-        except ValueError:
-            continue
-    
-    return ""
+    return parsed_date.strftime('%Y-%m-%d')
 
 def validate_birthday_dutch(birthday: str) -> bool:
     """
@@ -255,26 +277,26 @@ def validate_gender(gender: str) -> bool:
     """
     Validate gender (male or female)
     """
-    return gender.lower() in ['male', 'female', 'm', 'f', 'man', 'vrouw']
+    return gender.lower() in _GENDER_VALUES
 
 def validate_city(city: str) -> bool:
     """
     Validate city name (must be from predefined list)
     """
-    valid_cities = [
-        'Rotterdam', 'Amsterdam', 'Den Haag', 'Utrecht', 'Eindhoven',
-        'Groningen', 'Tilburg', 'Almere', 'Breda', 'Nijmegen'
-    ]
-    return city in valid_cities
+    return city in _VALID_CITIES
 
-def get_valid_cities() -> list:
+def get_valid_cities() -> tuple:
     """
-    Get list of valid city names
+    Get valid city names as an immutable tuple
     """
-    return [
+    return (
         'Rotterdam', 'Amsterdam', 'Den Haag', 'Utrecht', 'Eindhoven',
         'Groningen', 'Tilburg', 'Almere', 'Breda', 'Nijmegen'
-    ]
+    )
+
+# Set for membership checks and ready-made list of cities for the menus
+_VALID_CITIES = frozenset(get_valid_cities())
+CITIES_DISPLAY = ", ".join(get_valid_cities())
 
 def validate_percentage(value: str) -> bool:
     """
@@ -325,7 +347,7 @@ def validate_name(name: str) -> bool:
         return False
     
     # Only letters, spaces, apostrophes, hyphens
-    return bool(re.fullmatch(r"[A-Za-z\s'\-]{1,50}", name.strip()))
+    return bool(_NAME_RE.fullmatch(name.strip()))
 
 def validate_street_name(street: str) -> bool:
     """
@@ -335,7 +357,7 @@ def validate_street_name(street: str) -> bool:
         return False
     
     # Letters, numbers, spaces, common punctuation
-    return bool(re.fullmatch(r"[A-Za-z0-9\s.\-']{1,100}", street.strip()))
+    return bool(_STREET_NAME_RE.fullmatch(street.strip()))
 
 def validate_house_number(house_num: str) -> bool:
     """
@@ -344,8 +366,10 @@ def validate_house_number(house_num: str) -> bool:
     if not house_num or len(house_num.strip()) < 1:
         return False
     
-    # Numbers, possibly followed by letters
-    return bool(re.fullmatch(r'[0-9]+[A-Za-z]?', house_num.strip()))
+    # Numbers, possibly followed by a single letter (ASCII only)
+    house_num = house_num.strip()
+    digits = house_num[:-1] if house_num[-1].isalpha() else house_num
+    return house_num.isascii() and digits.isdigit()
 
 def validate_brand_model(text: str) -> bool:
     """
@@ -354,7 +378,7 @@ def validate_brand_model(text: str) -> bool:
     if not text or len(text.strip()) < 1:
         return False
     
-    return bool(re.fullmatch(r"[A-Za-z0-9\s\-_.]{1,50}", text.strip()))
+    return bool(_BRAND_MODEL_RE.fullmatch(text.strip()))
 
 def sanitize_input(text: str) -> str:
     """
@@ -364,7 +388,7 @@ def sanitize_input(text: str) -> str:
         return ""
     
     # Remove null bytes and control characters
-    sanitized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', str(text))
+    sanitized = _CONTROL_CHARS_RE.sub('', str(text))
     
     # Limit length
     return sanitized[:1000]
@@ -381,13 +405,37 @@ def validate_search_term(search_term: str) -> bool:
         return False
     
     # Allow alphanumeric, spaces, and common punctuation
-    return bool(re.fullmatch(r"[A-Za-z0-9\s@.\-_']{1,100}", search_term.strip()))
+    return bool(_SEARCH_TERM_RE.fullmatch(search_term.strip()))
 
 def check_back_command(user_input: str) -> bool:
     """
     Check if user wants to go back
     """
-    return user_input.lower().strip() in ['terug', 'back', 'b', 't', 'exit', 'quit']
+    return user_input.lower().strip() in _BACK_COMMANDS
+
+class BackException(BaseException):
+    """Raised by ask() when the user types a back command; not an Exception, so the broad error
+    handlers in the menus let it through to returns_on_back"""
+    pass
+
+def read_input(prompt: str = "") -> str:
+    """
+    Read a line of input; exits the program when input is closed (Ctrl-D or end of piped input)
+    """
+    try:
+        return input(prompt)
+    except EOFError:
+        print("\n\n🛑 Invoer beëindigd.")
+        raise SystemExit(0)
+
+def ask(prompt: str) -> str:
+    """
+    Read a stripped line of input, raises BackException on a back command
+    """
+    value = read_input(prompt).strip()
+    if value.lower() in _BACK_COMMANDS:
+        raise BackException
+    return value
 
 # Validation helper functions
 def get_validation_error_message(field: str, value: str) -> str:
@@ -421,13 +469,10 @@ def get_validation_error_message(field: str, value: str) -> str:
 def get_validated_input_with_back(prompt: str, validator_func, validation_type: str, allow_empty: bool = False) -> str:
     """
     Get validated input from user with retry on invalid input and back option
-    Returns None if user wants to go back
+    Raises BackException if user wants to go back
     """
     while True:
-        value = input(f"{prompt}: ").strip()
-        
-        if check_back_command(value):
-            return None
+        value = ask(f"{prompt}: ")
         
         if allow_empty and not value:
             return ""
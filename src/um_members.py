@@ -1,20 +1,45 @@
 import sys
 import os
+import time
 from datetime import datetime
+from functools import lru_cache, wraps
 
 # Import all modules
 from auth import (login, register_user, reset_password, change_own_password, 
                  validate_role_action, has_permission)
-from db import (init_db, get_all_users, update_user, delete_user, log_event,
-               add_traveller, get_all_travellers, search_travellers, update_traveller, delete_traveller,
-               add_scooter, get_all_scooters, search_scooters, update_scooter, delete_scooter,
-               get_logs, get_suspicious_logs, add_restore_code, get_restore_code, 
-               use_restore_code, revoke_restore_code)
-from backup import create_backup, restore_backup, list_backups, get_backup_statistics
+from db import (init_db, get_all_users, get_user_by_username, get_users_by_role, update_user, delete_user,
+               log_event, log_events_bulk,
+               add_traveller, get_traveller_by_id, get_all_travellers, search_travellers,
+               update_traveller, delete_traveller,
+               add_scooter, get_scooter_by_serial, get_all_scooters, search_scooters, get_scooter_stats,
+               update_scooter, delete_scooter, SCOOTER_FIELDS_BY_ROLE,
+               get_logs, get_log_page, get_log_counts, get_logs_summary, get_suspicious_logs, get_suspicious_log_version,
+               add_restore_code, add_restore_codes_bulk,
+               get_restore_code, use_restore_code, revoke_restore_code, get_statistics)
+from backup import (create_backup, restore_backup, list_backups, get_backup_statistics,
+                    invalidate_backup_cache, BACKUP_DIR, BACKUP_DIR_ABS)
 from input_validation import *
+from encryption import validate_encryption_setup
+import base64
 import uuid
 import secrets
 
+# Display names for the user roles
+ROLE_LABELS = {
+    'super_admin': 'Super Administrator',
+    'system_admin': 'System Administrator',
+    'service_engineer': 'Service Engineer'
+}
+
+# Accepted answers for confirmation prompts and for "male" in the gender field
+_YES = frozenset({'ja', 'j', 'yes', 'y'})
+_MALE = frozenset({'male', 'm', 'man'})
+
+# Suspicious-log count shown on the main menu, refreshed at most every 30 seconds
+# or as soon as a new suspicious event has been logged
+SUSPICIOUS_CACHE_TTL = 30.0
+_SUSP_CACHE = {'t': 0.0, 'n': 0, 'version': -1}
+
 def get_terminal_width():
     """Get current terminal width"""
     try:
@@ -38,32 +63,40 @@ def adjust_table_widths_for_terminal(base_widths: list) -> list:
     
     return base_widths
 
+# Whether the terminal understands ANSI escapes; Windows consoles only after enable_ansi_output()
+_ansi_output = os.name != 'nt'
+
+def enable_ansi_output():
+    """Switch on ANSI escape handling in the Windows console so clearing no longer spawns `cls`"""
+    global _ansi_output
+    if _ansi_output:
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        # 0x0004 = ENABLE_VIRTUAL_TERMINAL_PROCESSING (Windows 10 and later)
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and kernel32.SetConsoleMode(handle, mode.value | 0x0004):
+            _ansi_output = True
+    except (ImportError, AttributeError, OSError):
+        pass  # Older Windows console, keep using `cls`
+
 def clear_screen():
     """Clear terminal screen properly"""
-    import os
-    import sys
-    
-    # Force flush any pending output
-    sys.stdout.flush()
     sys.stderr.flush()
     
-    # Clear screen using appropriate command
-    if os.name == 'nt':  # Windows
+    if _ansi_output:
+        # ANSI clear screen + scrollback and cursor home, written directly instead of spawning `clear`
+        sys.stdout.write(_CLEAR_SEQUENCE)
+    else:
         os.system('cls')
-    else:  # Unix/Linux/Mac
-        os.system('clear')
-    
-    # Additional method to ensure clean screen
-    print('\033[2J\033[H', end='', flush=True)
-    
-    # Small delay to ensure screen is cleared
-    import time
-    time.sleep(0.01)
+    sys.stdout.flush()
 
 def pause():
     """Wait for user input and clear any lingering output"""
     try:
-        input("\nDruk Enter om door te gaan...")
+        read_input("\nDruk Enter om door te gaan...")
     except KeyboardInterrupt:
         pass  # Handle Ctrl+C gracefully
     
@@ -72,57 +105,209 @@ def pause():
     sys.stdout.flush()
     sys.stderr.flush()
 
+# Frame lines that never change are built once
+_HEADER_RULE = "=" * 80
+_TIP_RULE = "-" * 80
+_BACK_TIP = "💡 Tip: Typ 'terug' om terug te gaan naar het vorige menu"
+_CLEAR_SEQUENCE = '\033[2J\033[3J\033[H'
+
+@lru_cache(maxsize=64)
+def _header_text(title: str, show_back_info: bool) -> str:
+    """Formatted header block, including the trailing newline"""
+    text = f"{_HEADER_RULE}\n  {title}\n{_HEADER_RULE}\n"
+    if show_back_info:
+        text += f"{_BACK_TIP}\n{_TIP_RULE}\n"
+    return text
+
 def show_header(title: str, show_back_info: bool = True):
     """Show formatted header"""
-    print("=" * 80)
-    print(f"  {title}")
-    print("=" * 80)
-    if show_back_info:
-        print("💡 Tip: Typ 'terug' om terug te gaan naar het vorige menu")
-        print("-" * 80)
+    sys.stdout.write(_header_text(title, show_back_info))
+
+def clear_and_header(title: str, show_back_info: bool = True):
+    """Clear the screen and show the header in a single write"""
+    if not _ansi_output:
+        clear_screen()
+        show_header(title, show_back_info)
+        return
+    sys.stderr.flush()
+    sys.stdout.write(_CLEAR_SEQUENCE + _header_text(title, show_back_info))
+    sys.stdout.flush()
+
+@lru_cache(maxsize=32)
+def _table_separator(widths: tuple) -> str:
+    """Separator line for a table with the given column widths"""
+    return "+" + "".join("-" * (width + 2) + "+" for width in widths)
+
+@lru_cache(maxsize=32)
+def _table_header_block(headers: tuple, widths: tuple) -> str:
+    """Separator, header row and separator for a table, as one string"""
+    header_line = "| " + "".join(f"{header:<{width}} | " for header, width in zip(headers, widths))
+    separator_line = _table_separator(widths)
+    return f"{separator_line}\n{header_line}\n{separator_line}"
+
+@lru_cache(maxsize=32)
+def _table_row_template(widths: tuple) -> str:
+    """str.format template for one table row with the given column widths"""
+    return "| " + "".join(f"{{{i}:<{width}}} | " for i, width in enumerate(widths))
 
 def show_table_header(headers: list, widths: list):
     """Show formatted table header with vertical lines"""
-    header_line = "| "
-    separator_line = "+"
-    
-    for i, (header, width) in enumerate(zip(headers, widths)):
-        # Use the specified width consistently
-        header_line += f"{header:<{width}} | "
-        separator_line += "-" * (width + 2) + "+"
-    
-    print(separator_line)
-    print(header_line)
-    print(separator_line)
+    print(_table_header_block(tuple(headers), tuple(widths)))
 
-def format_table_row(values: list, widths: list) -> str:
-    """Format a table row with proper spacing and vertical lines"""
-    row = "| "
-    for i, (value, width) in enumerate(zip(values, widths)):
+def _fit_cells(values, widths) -> list:
+    """Cell texts for a table row, truncated to their column width"""
+    cells = []
+    for value, width in zip(values, widths):
         str_value = str(value) if value is not None else "..."
-        # Truncate if too long, otherwise pad to width
+        # Truncate if too long, padding is done by the template
         if len(str_value) > width:
             str_value = str_value[:width-2] + ".."
-        row += f"{str_value:<{width}} | "
-    return row
+        cells.append(str_value)
+    return cells
+
+def format_table_row(values: list, widths: list) -> str:
+    """Format a table row with proper spacing and vertical lines"""
+    cells = _fit_cells(values, widths)
+    return _table_row_template(tuple(widths[:len(cells)])).format(*cells)
 
 def show_table_footer(widths: list):
     """Show table footer line"""
-    footer_line = "+"
-    for width in widths:
-        footer_line += "-" * (width + 2) + "+"
-    print(footer_line)
+    print(_table_separator(tuple(widths)))
+
+# Scooter status labels, indexed by out_of_service_status
+_SCOOTER_STATUS = ("In dienst", "Buiten dienst")
+
+# Table layouts: base column widths (before fitting to the terminal) and headers
+_USER_TABLE_WIDTHS = (15, 20, 25, 15)
+_USER_TABLE_HEADERS = ('Gebruikersnaam', 'Rol', 'Naam', 'Registratie')
+_TRAVELLER_TABLE_WIDTHS = (12, 25, 30, 15, 12)
+_TRAVELLER_TABLE_HEADERS = ('Customer ID', 'Naam', 'Email', 'Telefoon', 'Stad')
+_TRAVELLER_SEARCH_TABLE_WIDTHS = (12, 25, 30, 15)
+_TRAVELLER_SEARCH_TABLE_HEADERS = ('Customer ID', 'Naam', 'Email', 'Telefoon')
+_SCOOTER_TABLE_WIDTHS = (17, 12, 15, 10, 10, 20, 12)
+_SCOOTER_TABLE_HEADERS = ('Serienummer', 'Merk', 'Model', 'Batterij %', 'Km-stand', 'Locatie', 'Status')
+_SCOOTER_SEARCH_TABLE_WIDTHS = (17, 12, 15, 10, 12)
+_SCOOTER_SEARCH_TABLE_HEADERS = ('Serienummer', 'Merk', 'Model', 'Batterij %', 'Status')
+_BACKUP_TABLE_WIDTHS = (25, 20, 12, 15)
+_BACKUP_TABLE_HEADERS = ('Bestandsnaam', 'Aangemaakt', 'Grootte (MB)', 'Door')
+_LOG_TABLE_WIDTHS = (3, 12, 8, 15, 35, 8)
+_LOG_TABLE_HEADERS = ('Nr', 'Datum', 'Tijd', 'Gebruiker', 'Beschrijving', 'Verdacht')
+# Verdacht column label, indexed by the suspicious flag
+_LOG_SUSPICIOUS_LABELS = ("Nee", "Ja")
+
+# Input forms: (key, prompt, validator, validation type, hint printed before the prompt)
+_TRAVELLER_FIELDS = [
+    ('first_name', "Voornaam", validate_name, "name", None),
+    ('last_name', "Achternaam", validate_name, "name", None),
+    ('birthday', "Geboortedatum (bijv. 15-03-1990, 15/03/90)", validate_flexible_date, "flexible_date", None),
+    ('gender', "Geslacht", validate_gender, "gender", "\nGeslacht opties: male, female, m, f, man, vrouw"),
+    ('street_name', "Straatnaam", validate_street_name, "name", None),
+    ('house_number', "Huisnummer", validate_house_number, "house_number", None),
+    ('zip_code', "Postcode (1234AB)", validate_zip_code, "zip_code", None),
+    ('city', "Stad", validate_city, "city", f"\nBeschikbare steden: {CITIES_DISPLAY}"),
+    ('email_address', "Email adres", validate_email, "email", None),
+    ('mobile_phone', "Mobiel (8 cijfers, +31-6- wordt toegevoegd)", validate_mobile_phone, "mobile_phone", None),
+    ('driving_license_number', "Rijbewijsnummer (XXDDDDDDD of XDDDDDDDD)", validate_driving_license, "driving_license", None),
+]
+
+_SCOOTER_FIELDS = [
+    ('brand', "Merk", validate_brand_model, "brand", None),
+    ('model', "Model", validate_brand_model, "model", None),
+    ('serial_number', "Serienummer (10-17 tekens)", validate_serial_number, "serial_number", None),
+    ('top_speed', "Topsnelheid (km/h)", validate_positive_integer, "positive_integer", None),
+    ('battery_capacity', "Batterijcapaciteit (Wh)", validate_positive_integer, "positive_integer", None),
+    ('state_of_charge', "Huidige batterijlading (0-100%)", validate_percentage, "percentage", None),
+]
+
+def normalise_gender(gender: str) -> str:
+    """Map any accepted gender input to the stored 'male'/'female' value"""
+    return 'male' if gender.lower() in _MALE else 'female'
+
+# Update traveller form: (field, label, prompt hint, validator, normaliser, error message)
+_TRAVELLER_UPDATE_FIELDS = [
+    ('first_name', "Voornaam", "", validate_name, None,
+     "❌ Ongeldige voornaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan."),
+    ('last_name', "Achternaam", "", validate_name, None,
+     "❌ Ongeldige achternaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan."),
+    ('birthday', "Geboortedatum", " (bijv. 15-03-1990)", validate_flexible_date, convert_flexible_date_to_iso,
+     "❌ Ongeldige datum. Gebruik formaat dd-mm-jjjj of dd/mm/jj."),
+    ('gender', "Geslacht", " (male/female/m/f)", validate_gender, normalise_gender,
+     "❌ Ongeldig geslacht. Gebruik male, female, m, f, man, of vrouw."),
+    ('street_name', "Straatnaam", "", validate_street_name, None, "❌ Ongeldige straatnaam."),
+    ('house_number', "Huisnummer", "", validate_house_number, None, "❌ Ongeldig huisnummer."),
+    ('zip_code', "Postcode", "", validate_zip_code, str.upper, "❌ Ongeldige postcode. Gebruik formaat 1234AB."),
+    ('city', "Stad", "", validate_city, None, f"❌ Ongeldige stad. Beschikbare steden: {CITIES_DISPLAY}"),
+    ('email_address', "Email", "", validate_email, None, "❌ Ongeldig email format."),
+    ('mobile_phone', "Mobiel nummer", "", validate_mobile_phone, None, "❌ Ongeldig telefoonnummer. Voer 8 cijfers in."),
+    ('driving_license_number', "Rijbewijsnummer", "", validate_driving_license, str.upper,
+     "❌ Ongeldig rijbewijsnummer. Gebruik formaat XXDDDDDDD of XDDDDDDDD."),
+]
+
+# Current scooter details shown above the update form; 'status' is added by the caller
+_SCOOTER_DETAILS_TEMPLATE = (
+    "\nHuidige gegevens van scooter {serial_number}:\n"
+    "🏭 Merk/Model: {brand} {model}\n"
+    "⚡ Topsnelheid: {top_speed} km/h\n"
+    "🔋 Batterijcapaciteit: {battery_capacity} Wh\n"
+    "🔋 Batterijlading: {state_of_charge}%\n"
+    "🎯 Batterijbereik: {target_range_soc}\n"
+    "📍 Locatie: {location}\n"
+    "🚦 Status: {status}\n"
+    "🛣️  Kilometerstand: {mileage} km\n"
+)
+
+# Update scooter form, validated fields only: (field, label, unit shown after the current value,
+# validator, converter, error message)
+_SCOOTER_UPDATE_FIELDS = [
+    ('brand', "Merk", "", validate_brand_model, None, "❌ Ongeldige merk naam."),
+    ('model', "Model", "", validate_brand_model, None, "❌ Ongeldige model naam."),
+    ('top_speed', "Topsnelheid", " km/h", validate_positive_integer, int, "❌ Moet een positief getal zijn."),
+    ('battery_capacity', "Batterijcapaciteit", " Wh", validate_positive_integer, int, "❌ Moet een positief getal zijn."),
+]
+
+def returns_on_back(menu):
+    """Return from the wrapped menu when one of its ask() prompts raises BackException"""
+    @wraps(menu)
+    def wrapper(*args, **kwargs):
+        try:
+            return menu(*args, **kwargs)
+        except BackException:
+            return None
+    return wrapper
+
+def prompt_optional_field(prompt: str, validator, error: str):
+    """Ask for a new value until it validates; returns '' if left empty, raises BackException on back"""
+    while True:
+        value = ask(prompt)
+        if not value or validator(value):
+            return value
+        print(error)
+
+def collect_validated_fields(fields: list) -> dict:
+    """Prompt for each form field in order, raises BackException if the user goes back"""
+    values = {}
+    for key, prompt, validator, validation_type, hint in fields:
+        if hint:
+            print(hint)
+        values[key] = get_validated_input_with_back(prompt, validator, validation_type)
+    return values
 
 def show_suspicious_alerts(username: str, role: str):
     """Show alerts for suspicious activities"""
     if role in ['super_admin', 'system_admin']:
-        try:
-            suspicious = get_suspicious_logs()
-            if suspicious:
-                print(f"\n⚠️  WAARSCHUWING: {len(suspicious)} verdachte activiteiten gedetecteerd!")
-                print("   Bekijk de logs voor meer details.")
-        except:
-            pass  # Skip if logs not available
+        now = time.monotonic()
+        version = get_suspicious_log_version()
+        if version != _SUSP_CACHE['version'] or now - _SUSP_CACHE['t'] > SUSPICIOUS_CACHE_TTL:
+            try:
+                _SUSP_CACHE['n'] = get_log_counts()[1]
+            except:
+                pass  # Skip if logs not available
+            _SUSP_CACHE['t'] = now
+            _SUSP_CACHE['version'] = version
+        
+        if _SUSP_CACHE['n']:
+            print(f"\n⚠️  WAARSCHUWING: {_SUSP_CACHE['n']} verdachte activiteiten gedetecteerd!")
+            print("   Bekijk de logs voor meer details.")
 
 def get_role_menu(role: str) -> list:
     """Get menu options for user role"""
@@ -159,8 +344,7 @@ def get_role_menu(role: str) -> list:
 
 def show_main_menu(username: str, role: str):
     """Display main menu and get user choice"""
-    clear_screen()
-    show_header(f"Urban Mobility Backend - Welkom {username} ({role})", False)
+    clear_and_header(f"Urban Mobility Backend - Welkom {username} ({role})", False)
     
     # Show suspicious activity alerts
     show_suspicious_alerts(username, role)
@@ -173,40 +357,47 @@ def show_main_menu(username: str, role: str):
     print(f"  {len(menu_items) + 1}. Afsluiten")
     
     while True:
-        try:
-            choice = input(f"\nKies een optie (1-{len(menu_items) + 1}): ")
-            
-            if check_back_command(choice):
-                return "logout"
-            
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(menu_items):
-                return menu_items[choice_num - 1][1]
-            elif choice_num == len(menu_items) + 1:
-                return "exit"
-            else:
-                print(f"Ongeldige keuze, kies tussen 1 en {len(menu_items) + 1}.")
-        except ValueError:
+        choice = read_input(f"\nKies een optie (1-{len(menu_items) + 1}): ").strip()
+        
+        if check_back_command(choice):
+            return "logout"
+        
+        if not choice.isdecimal():
             print("Voer een geldig nummer in.")
+            continue
+        
+        choice_num = int(choice)
+        if 1 <= choice_num <= len(menu_items):
+            return menu_items[choice_num - 1][1]
+        elif choice_num == len(menu_items) + 1:
+            return "exit"
+        else:
+            print(f"Ongeldige keuze, kies tussen 1 en {len(menu_items) + 1}.")
 
 # ============================================================================
 # USER MANAGEMENT FUNCTIONS
 # ============================================================================
 
+_USER_MENU_TEXT = (
+    "1. Alle gebruikers bekijken\n"
+    "2. Nieuwe gebruiker aanmaken\n"
+    "3. Gebruiker bijwerken\n"
+    "4. Gebruiker verwijderen\n"
+    "5. Wachtwoord resetten\n"
+    "6. Terug naar hoofdmenu\n"
+)
+
 def user_management_menu(username: str, role: str):
     """User management submenu"""
+    redraw = True
     while True:
-        clear_screen()
-        show_header("Gebruikersbeheer")
-        
-        print("1. Alle gebruikers bekijken")
-        print("2. Nieuwe gebruiker aanmaken")
-        print("3. Gebruiker bijwerken") 
-        print("4. Gebruiker verwijderen")
-        print("5. Wachtwoord resetten")
-        print("6. Terug naar hoofdmenu")
+        # An invalid choice only reprompts; the screen is redrawn after an action
+        if redraw:
+            clear_and_header("Gebruikersbeheer")
+            sys.stdout.write(_USER_MENU_TEXT)
+        redraw = True
         
-        choice = input("\nKies een optie (1-6): ")
+        choice = read_input("\nKies een optie (1-6): ")
         
         if check_back_command(choice) or choice == "6":
             break
@@ -224,25 +415,24 @@ def user_management_menu(username: str, role: str):
             reset_user_password_interactive(username, role)
         else:
             print("Ongeldige keuze.")
-            pause()
+            redraw = False
 
 def view_all_users():
     """Display all users in formatted table"""
-    clear_screen()
-    show_header("Alle Gebruikers")
+    clear_and_header("Alle Gebruikers")
     
     try:
+        # Rows are formatted into one buffer and written with a single stdout write
         users = get_all_users()
         if not users:
             print("Geen gebruikers gevonden.")
         else:
             # Define column widths and adjust for terminal
-            base_widths = [15, 20, 25, 15]
-            widths = adjust_table_widths_for_terminal(base_widths)
-            headers = ['Gebruikersnaam', 'Rol', 'Naam', 'Registratie']
+            widths = adjust_table_widths_for_terminal(_USER_TABLE_WIDTHS)
             
-            show_table_header(headers, widths)
+            show_table_header(_USER_TABLE_HEADERS, widths)
             
+            lines = []
             for user in users:
                 name = f"{user['first_name']} {user['last_name']}"
                 values = [
@@ -251,32 +441,28 @@ def view_all_users():
                     name, 
                     user['registration_date']
                 ]
-                print(format_table_row(values, widths))
+                lines.append(format_table_row(values, widths))
             
+            sys.stdout.write("\n".join(lines) + "\n")
             show_table_footer(widths)
-            print(f"\nTotaal: {len(users)} gebruikers")
+            print(f"\nTotaal: {len(lines)} gebruikers")
     except Exception as e:
         print(f"❌ Fout bij ophalen gebruikers: {e}")
     
     pause()
 
+@returns_on_back
 def create_new_user(current_username: str, current_role: str):
     """Create new user with validation and back option"""
-    clear_screen()
-    show_header("Nieuwe Gebruiker Aanmaken")
+    clear_and_header("Nieuwe Gebruiker Aanmaken")
     
     try:
         # Get user details with back option and username uniqueness check
         while True:
             username = get_validated_input_with_back("Gebruikersnaam (8-10 tekens)", validate_username, "username")
-            if username is None:
-                return
             
             # Check if username already exists (case-insensitive)
-            existing_users = get_all_users()
-            username_exists = any(u['username'].lower() == username.lower() for u in existing_users)
-            
-            if username_exists:
+            if get_user_by_username(username):
                 print(f"❌ Gebruikersnaam '{username}' bestaat al. Kies een andere gebruikersnaam.")
                 continue
             else:
@@ -284,8 +470,6 @@ def create_new_user(current_username: str, current_role: str):
                 break
         
         password = get_validated_input_with_back("Wachtwoord (12-30 tekens, complex)", validate_password, "password")
-        if password is None:
-            return
         
         # Role selection based on permissions
         available_roles = []
@@ -301,26 +485,14 @@ def create_new_user(current_username: str, current_role: str):
         
         print(f"\nBeschikbare rollen: {', '.join(available_roles)}")
         while True:
-            role = input("Rol: ").strip()
-            if check_back_command(role):
-                return
+            role = ask("Rol: ")
             if role in available_roles:
                 break
             print(f"❌ Ongeldige rol. Kies uit: {', '.join(available_roles)}")
         
         first_name = get_validated_input_with_back("Voornaam", validate_name, "name")
-        if first_name is None:
-            return
         
         last_name = get_validated_input_with_back("Achternaam", validate_name, "name")
-        if last_name is None:
-            return
-        
-        # Final validation before creating user
-        if not all([username, password, role, first_name, last_name]):
-            print("❌ Niet alle verplichte velden zijn ingevuld. Gebruiker wordt niet aangemaakt.")
-            pause()
-            return
         
         # Create user
         success, message = register_user(username, password, role, first_name, last_name, current_role)
@@ -333,15 +505,12 @@ def create_new_user(current_username: str, current_role: str):
     
     pause()
 
+@returns_on_back
 def update_existing_user(current_username: str, current_role: str):
     """Update existing user - all fields editable"""
-    clear_screen()
-    show_header("Gebruiker Bijwerken")
+    clear_and_header("Gebruiker Bijwerken")
     
-    username = input("Gebruikersnaam om bij te werken: ").strip()
-    
-    if check_back_command(username):
-        return
+    username = ask("Gebruikersnaam om bij te werken: ")
     
     if not username:
         print("❌ Gebruikersnaam is verplicht")
@@ -350,13 +519,7 @@ def update_existing_user(current_username: str, current_role: str):
     
     try:
         # Get current user info
-        users = get_all_users()
-        user_to_update = None
-        
-        for u in users:
-            if u['username'].lower() == username.lower():
-                user_to_update = u
-                break
+        user_to_update = get_user_by_username(username)
         
         if not user_to_update:
             print(f"❌ Gebruiker {username} niet gevonden")
@@ -374,48 +537,27 @@ def update_existing_user(current_username: str, current_role: str):
         updates = {}
         
         # First name validation
-        while True:
-            new_first_name = input(f"Voornaam ({user_to_update['first_name']}): ").strip()
-            if check_back_command(new_first_name):
-                return
-            
-            if not new_first_name:
-                break
-            elif validate_name(new_first_name):
-                updates['first_name'] = new_first_name
-                break
-            else:
-                print("❌ Ongeldige voornaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan.")
+        new_first_name = prompt_optional_field(
+            f"Voornaam ({user_to_update['first_name']}): ", validate_name,
+            "❌ Ongeldige voornaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan.")
+        if new_first_name:
+            updates['first_name'] = new_first_name
         
         # Last name validation
-        while True:
-            new_last_name = input(f"Achternaam ({user_to_update['last_name']}): ").strip()
-            if check_back_command(new_last_name):
-                return
-            
-            if not new_last_name:
-                break
-            elif validate_name(new_last_name):
-                updates['last_name'] = new_last_name
-                break
-            else:
-                print("❌ Ongeldige achternaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan.")
+        new_last_name = prompt_optional_field(
+            f"Achternaam ({user_to_update['last_name']}): ", validate_name,
+            "❌ Ongeldige achternaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan.")
+        if new_last_name:
+            updates['last_name'] = new_last_name
         
         # Role validation (only if super admin)
         if current_role == 'super_admin':
             available_roles = ['super_admin', 'system_admin', 'service_engineer']
-            while True:
-                new_role = input(f"Rol ({user_to_update['role']}) - opties: {', '.join(available_roles)}: ").strip()
-                if check_back_command(new_role):
-                    return
-                
-                if not new_role:
-                    break
-                elif new_role in available_roles:
-                    updates['role'] = new_role
-                    break
-                else:
-                    print(f"❌ Ongeldige rol. Kies uit: {', '.join(available_roles)}")
+            new_role = prompt_optional_field(
+                f"Rol ({user_to_update['role']}) - opties: {', '.join(available_roles)}: ",
+                lambda role: role in available_roles, f"❌ Ongeldige rol. Kies uit: {', '.join(available_roles)}")
+            if new_role:
+                updates['role'] = new_role
         
         if not updates:
             print("Geen wijzigingen opgegeven")
@@ -435,15 +577,12 @@ def update_existing_user(current_username: str, current_role: str):
     
     pause()
 
+@returns_on_back
 def delete_existing_user(current_username: str, current_role: str):
     """Delete existing user"""
-    clear_screen()
-    show_header("Gebruiker Verwijderen")
+    clear_and_header("Gebruiker Verwijderen")
     
-    username = input("Gebruikersnaam om te verwijderen: ").strip()
-    
-    if check_back_command(username):
-        return
+    username = ask("Gebruikersnaam om te verwijderen: ")
     
     if not username:
         print("❌ Gebruikersnaam is verplicht")
@@ -461,13 +600,7 @@ def delete_existing_user(current_username: str, current_role: str):
     
     try:
         # Get user info
-        users = get_all_users()
-        user_to_delete = None
-        
-        for u in users:
-            if u['username'].lower() == username.lower():
-                user_to_delete = u
-                break
+        user_to_delete = get_user_by_username(username)
         
         if not user_to_delete:
             print(f"❌ Gebruiker {username} niet gevonden")
@@ -488,7 +621,7 @@ def delete_existing_user(current_username: str, current_role: str):
             
             # First confirmation with retry loop
             while True:
-                confirm1 = input("\n⚠️  Weet je ZEKER dat je je eigen account wilt verwijderen? (typ 'ja zeker' of 'nee'): ").strip()
+                confirm1 = read_input("\n⚠️  Weet je ZEKER dat je je eigen account wilt verwijderen? (typ 'ja zeker' of 'nee'): ").strip()
                 if confirm1.upper() == 'JA ZEKER':
                     break  # Continue to next confirmation
                 elif confirm1.upper() == 'NEE' or confirm1.upper() == 'N':
@@ -501,7 +634,7 @@ def delete_existing_user(current_username: str, current_role: str):
             
             # Second confirmation with retry loop
             while True:
-                confirm2 = input(f"\n⚠️  Laatste bevestiging: Typ je gebruikersnaam '{username}' om te bevestigen (of 'nee' om te annuleren): ").strip()
+                confirm2 = read_input(f"\n⚠️  Laatste bevestiging: Typ je gebruikersnaam '{username}' om te bevestigen (of 'nee' om te annuleren): ").strip()
                 if confirm2 == username:
                     break  # Continue to deletion
                 elif confirm2.upper() == 'NEE' or confirm2.upper() == 'N':
@@ -513,9 +646,9 @@ def delete_existing_user(current_username: str, current_role: str):
                     continue
         else:
             # Regular confirmation for other users
-            confirm = input(f"\n⚠️  Weet je zeker dat je gebruiker {name} ({username}) wilt verwijderen? (ja/nee): ").strip().lower()
+            confirm = read_input(f"\n⚠️  Weet je zeker dat je gebruiker {name} ({username}) wilt verwijderen? (ja/nee): ").strip().lower()
             
-            if confirm not in ['ja', 'j', 'yes', 'y']:
+            if confirm not in _YES:
                 print("Verwijdering geannuleerd")
                 pause()
                 return
@@ -540,15 +673,12 @@ def delete_existing_user(current_username: str, current_role: str):
     
     pause()
 
+@returns_on_back
 def reset_user_password_interactive(current_username: str, current_role: str):
     """Reset user password interactively"""
-    clear_screen()
-    show_header("Wachtwoord Resetten")
-    
-    username = input("Gebruikersnaam voor wachtwoord reset: ").strip()
+    clear_and_header("Wachtwoord Resetten")
     
-    if check_back_command(username):
-        return
+    username = ask("Gebruikersnaam voor wachtwoord reset: ")
     
     if not username:
         print("❌ Gebruikersnaam is verplicht")
@@ -573,20 +703,25 @@ def reset_user_password_interactive(current_username: str, current_role: str):
 # TRAVELLER MANAGEMENT FUNCTIONS
 # ============================================================================
 
+_TRAVELLER_MENU_TEXT = (
+    "1. Alle reizigers bekijken\n"
+    "2. Reiziger zoeken\n"
+    "3. Nieuwe reiziger toevoegen\n"
+    "4. Reiziger bijwerken\n"
+    "5. Reiziger verwijderen\n"
+    "6. Terug naar hoofdmenu\n"
+)
+
 def traveller_management_menu(username: str, role: str):
     """Traveller management submenu"""
+    redraw = True
     while True:
-        clear_screen()
-        show_header("Reiziger Beheer")
+        if redraw:
+            clear_and_header("Reiziger Beheer")
+            sys.stdout.write(_TRAVELLER_MENU_TEXT)
+        redraw = True
         
-        print("1. Alle reizigers bekijken")
-        print("2. Reiziger zoeken")
-        print("3. Nieuwe reiziger toevoegen")
-        print("4. Reiziger bijwerken")
-        print("5. Reiziger verwijderen") 
-        print("6. Terug naar hoofdmenu")
-        
-        choice = input("\nKies een optie (1-6): ")
+        choice = read_input("\nKies een optie (1-6): ")
         
         if check_back_command(choice) or choice == "6":
             break
@@ -602,47 +737,45 @@ def traveller_management_menu(username: str, role: str):
             delete_traveller_menu(username)
         else:
             print("Ongeldige keuze.")
-            pause()
+            redraw = False
 
 def view_all_travellers_menu():
     """Display all travellers in formatted table"""
-    clear_screen()
-    show_header("Alle Reizigers")
+    clear_and_header("Alle Reizigers")
     
     try:
+        # Rows are formatted into one buffer and written with a single stdout write
         travellers = get_all_travellers()
         if not travellers:
             print("Geen reizigers gevonden.")
         else:
             # Define column widths and adjust for terminal
-            base_widths = [12, 25, 30, 15, 12]
-            widths = adjust_table_widths_for_terminal(base_widths)
-            headers = ['Customer ID', 'Naam', 'Email', 'Telefoon', 'Stad']
+            widths = adjust_table_widths_for_terminal(_TRAVELLER_TABLE_WIDTHS)
             
-            show_table_header(headers, widths)
+            show_table_header(_TRAVELLER_TABLE_HEADERS, widths)
             
+            lines = []
             for t in travellers:
                 name = f"{t['first_name']} {t['last_name']}"
                 phone = f"+31-6-{t['mobile_phone']}"
                 values = [t['customer_id'], name, t['email_address'], phone, t['city']]
-                print(format_table_row(values, widths))
+                lines.append(format_table_row(values, widths))
             
+            sys.stdout.write("\n".join(lines) + "\n")
             show_table_footer(widths)
-            print(f"\nTotaal: {len(travellers)} reizigers")
+            print(f"\nTotaal: {len(lines)} reizigers")
     except Exception as e:
         print(f"❌ Fout bij ophalen reizigers: {e}")
     
     pause()
 
+@returns_on_back
 def search_travellers_menu():
     """Search travellers"""
-    clear_screen()
-    show_header("Reiziger Zoeken")
+    clear_and_header("Reiziger Zoeken")
     
     try:
         search_term = get_validated_input_with_back("Zoekterm (naam, email, customer ID)", validate_search_term, "search_term")
-        if search_term is None:
-            return
         
         results = search_travellers(search_term)
         
@@ -651,17 +784,17 @@ def search_travellers_menu():
         else:
             print(f"\n{len(results)} resultaten gevonden voor '{search_term}':")
             
-            base_widths = [12, 25, 30, 15]
-            widths = adjust_table_widths_for_terminal(base_widths)
-            headers = ['Customer ID', 'Naam', 'Email', 'Telefoon']
+            widths = adjust_table_widths_for_terminal(_TRAVELLER_SEARCH_TABLE_WIDTHS)
             
-            show_table_header(headers, widths)
+            show_table_header(_TRAVELLER_SEARCH_TABLE_HEADERS, widths)
             
+            lines = []
             for t in results:
                 name = f"{t['first_name']} {t['last_name']}"
                 phone = f"+31-6-{t['mobile_phone']}"
                 values = [t['customer_id'], name, t['email_address'], phone]
-                print(format_table_row(values, widths))
+                lines.append(format_table_row(values, widths))
+            sys.stdout.write("\n".join(lines) + "\n")
             
             show_table_footer(widths)
     except Exception as e:
@@ -669,72 +802,31 @@ def search_travellers_menu():
     
     pause()
 
+@returns_on_back
 def create_traveller_menu(username: str):
     """Add new traveller with Dutch date format"""
-    clear_screen()
-    show_header("Nieuwe Reiziger Toevoegen")
+    clear_and_header("Nieuwe Reiziger Toevoegen")
     
     try:
         # Collect all required information with back option
-        first_name = get_validated_input_with_back("Voornaam", validate_name, "name")
-        if first_name is None: return
-        
-        last_name = get_validated_input_with_back("Achternaam", validate_name, "name")
-        if last_name is None: return
+        values = collect_validated_fields(_TRAVELLER_FIELDS)
         
-        birthday = get_validated_input_with_back("Geboortedatum (bijv. 15-03-1990, 15/03/90)", validate_flexible_date, "flexible_date")
-        if birthday is None: return
-        # Convert to ISO for storage
-        birthday = convert_flexible_date_to_iso(birthday)
-        
-        # Gender validation with options
-        print("\nGeslacht opties: male, female, m, f, man, vrouw")
-        gender = get_validated_input_with_back("Geslacht", validate_gender, "gender")
-        if gender is None: return
-        gender = 'male' if gender.lower() in ['male', 'm', 'man'] else 'female'
-        
-        street_name = get_validated_input_with_back("Straatnaam", validate_street_name, "name")
-        if street_name is None: return
-        
-        house_number = get_validated_input_with_back("Huisnummer", validate_house_number, "house_number")
-        if house_number is None: return
-        
-        zip_code = get_validated_input_with_back("Postcode (1234AB)", validate_zip_code, "zip_code")
-        if zip_code is None: return
-        zip_code = zip_code.upper()
-        
-        # Show available cities
-        cities = get_valid_cities()
-        print(f"\nBeschikbare steden: {', '.join(cities)}")
-        city = get_validated_input_with_back("Stad", validate_city, "city")
-        if city is None: return
-        
-        email = get_validated_input_with_back("Email adres", validate_email, "email")
-        if email is None: return
-        
-        mobile_phone = get_validated_input_with_back("Mobiel (8 cijfers, +31-6- wordt toegevoegd)", validate_mobile_phone, "mobile_phone")
-        if mobile_phone is None: return
-        
-        license_number = get_validated_input_with_back("Rijbewijsnummer (XXDDDDDDD of XDDDDDDDD)", validate_driving_license, "driving_license")
-        if license_number is None: return
-        license_number = license_number.upper()
-        
-        # Final validation before adding traveller
-        if not all([first_name, last_name, birthday, gender, street_name, house_number, zip_code, city, email, mobile_phone, license_number]):
-            print("❌ Niet alle verplichte velden zijn ingevuld. Reiziger wordt niet toegevoegd.")
-            pause()
-            return
+        # Normalise for storage
+        values['birthday'] = convert_flexible_date_to_iso(values['birthday'])
+        values['gender'] = normalise_gender(values['gender'])
+        values['zip_code'] = values['zip_code'].upper()
+        values['driving_license_number'] = values['driving_license_number'].upper()
         
         # Add traveller
-        customer_id = add_traveller(first_name, last_name, birthday, gender, street_name, 
-                                   house_number, zip_code, city, email, mobile_phone, license_number)
+        customer_id = add_traveller(**values)
         
         if customer_id:
+            name = f"{values['first_name']} {values['last_name']}"
             print(f"\n✅ Reiziger succesvol toegevoegd!")
             print(f"📋 Customer ID: {customer_id}")
-            print(f"👤 Naam: {first_name} {last_name}")
-            print(f"📧 Email: {email}")
-            log_event(f"Nieuwe reiziger toegevoegd", username, f"Customer ID: {customer_id}, Naam: {first_name} {last_name}")
+            print(f"👤 Naam: {name}")
+            print(f"📧 Email: {values['email_address']}")
+            log_event(f"Nieuwe reiziger toegevoegd", username, f"Customer ID: {customer_id}, Naam: {name}")
         else:
             print("\n❌ Fout bij toevoegen reiziger.")
     except Exception as e:
@@ -742,15 +834,12 @@ def create_traveller_menu(username: str):
     
     pause()
 
+@returns_on_back
 def update_traveller_menu(username: str):
     """Update traveller - all fields editable"""
-    clear_screen()
-    show_header("Reiziger Bijwerken")
-    
-    customer_id = input("Customer ID van reiziger om bij te werken: ").strip()
+    clear_and_header("Reiziger Bijwerken")
     
-    if check_back_command(customer_id):
-        return
+    customer_id = ask("Customer ID van reiziger om bij te werken: ")
     
     if not customer_id:
         print("❌ Customer ID is verplicht")
@@ -759,13 +848,7 @@ def update_traveller_menu(username: str):
     
     try:
         # Get current traveller info
-        travellers = get_all_travellers()
-        current_traveller = None
-        
-        for t in travellers:
-            if t['customer_id'] == customer_id:
-                current_traveller = t
-                break
+        current_traveller = get_traveller_by_id(customer_id)
         
         if not current_traveller:
             print(f"❌ Reiziger met ID {customer_id} niet gevonden")
@@ -786,160 +869,10 @@ def update_traveller_menu(username: str):
         
         print("\nVoer nieuwe waarden in (laat leeg om ongewijzigd te laten):")
         
-        # First name validation
-        while True:
-            new_first_name = input(f"Voornaam ({current_traveller['first_name']}): ").strip()
-            if check_back_command(new_first_name):
-                return
-            
-            if not new_first_name:
-                break
-            elif validate_name(new_first_name):
-                updates['first_name'] = new_first_name
-                break
-            else:
-                print("❌ Ongeldige voornaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan.")
-        
-        # Last name validation
-        while True:
-            new_last_name = input(f"Achternaam ({current_traveller['last_name']}): ").strip()
-            if check_back_command(new_last_name):
-                return
-            
-            if not new_last_name:
-                break
-            elif validate_name(new_last_name):
-                updates['last_name'] = new_last_name
-                break
-            else:
-                print("❌ Ongeldige achternaam. Alleen letters, spaties, apostroffen en koppeltekens toegestaan.")
-        
-        # Birthday validation
-        while True:
-            new_birthday = input(f"Geboortedatum ({current_traveller['birthday']}) (bijv. 15-03-1990): ").strip()
-            if check_back_command(new_birthday):
-                return
-            
-            if not new_birthday:
-                break
-            elif validate_flexible_date(new_birthday):
-                updates['birthday'] = convert_flexible_date_to_iso(new_birthday)
-                break
-            else:
-                print("❌ Ongeldige datum. Gebruik formaat dd-mm-jjjj of dd/mm/jj.")
-        
-        # Gender validation
-        while True:
-            new_gender = input(f"Geslacht ({current_traveller['gender']}) (male/female/m/f): ").strip()
-            if check_back_command(new_gender):
-                return
-            
-            if not new_gender:
-                break
-            elif validate_gender(new_gender):
-                updates['gender'] = 'male' if new_gender.lower() in ['male', 'm', 'man'] else 'female'
-                break
-            else:
-                print("❌ Ongeldig geslacht. Gebruik male, female, m, f, man, of vrouw.")
-        
-        # Street name validation
-        while True:
-            new_street = input(f"Straatnaam ({current_traveller['street_name']}): ").strip()
-            if check_back_command(new_street):
-                return
-            
-            if not new_street:
-                break
-            elif validate_street_name(new_street):
-                updates['street_name'] = new_street
-                break
-            else:
-                print("❌ Ongeldige straatnaam.")
-        
-        # House number validation
-        while True:
-            new_house_number = input(f"Huisnummer ({current_traveller['house_number']}): ").strip()
-            if check_back_command(new_house_number):
-                return
-            
-            if not new_house_number:
-                break
-            elif validate_house_number(new_house_number):
-                updates['house_number'] = new_house_number
-                break
-            else:
-                print("❌ Ongeldig huisnummer.")
-        
-        # Zip code validation
-        while True:
-            new_zip = input(f"Postcode ({current_traveller['zip_code']}): ").strip()
-            if check_back_command(new_zip):
-                return
-            
-            if not new_zip:
-                break
-            elif validate_zip_code(new_zip):
-                updates['zip_code'] = new_zip.upper()
-                break
-            else:
-                print("❌ Ongeldige postcode. Gebruik formaat 1234AB.")
-        
-        # City validation
-        while True:
-            new_city = input(f"Stad ({current_traveller['city']}): ").strip()
-            if check_back_command(new_city):
-                return
-            
-            if not new_city:
-                break
-            elif validate_city(new_city):
-                updates['city'] = new_city
-                break
-            else:
-                cities = get_valid_cities()
-                print(f"❌ Ongeldige stad. Beschikbare steden: {', '.join(cities)}")
-        
-        # Email validation
-        while True:
-            new_email = input(f"Email ({current_traveller['email_address']}): ").strip()
-            if check_back_command(new_email):
-                return
-            
-            if not new_email:
-                break
-            elif validate_email(new_email):
-                updates['email_address'] = new_email
-                break
-            else:
-                print("❌ Ongeldig email format.")
-        
-        # Phone validation
-        while True:
-            new_phone = input(f"Mobiel nummer ({current_traveller['mobile_phone']}): ").strip()
-            if check_back_command(new_phone):
-                return
-            
-            if not new_phone:
-                break
-            elif validate_mobile_phone(new_phone):
-                updates['mobile_phone'] = new_phone
-                break
-            else:
-                print("❌ Ongeldig telefoonnummer. Voer 8 cijfers in.")
-        
-        # Driving license validation
-        while True:
-            new_license = input(f"Rijbewijsnummer ({current_traveller['driving_license_number']}): ").strip()
-            if check_back_command(new_license):
-                return
-            
-            if not new_license:
-                break
-            elif validate_driving_license(new_license):
-                updates['driving_license_number'] = new_license.upper()
-                break
-            else:
-                print("❌ Ongeldig rijbewijsnummer. Gebruik formaat XXDDDDDDD of XDDDDDDDD.")
+        for field, label, hint, validator, normalise, error in _TRAVELLER_UPDATE_FIELDS:
+            new_value = prompt_optional_field(f"{label} ({current_traveller[field]}){hint}: ", validator, error)
+            if new_value:
+                updates[field] = normalise(new_value) if normalise else new_value
         
         if not updates:
             print("Geen wijzigingen opgegeven")
@@ -959,15 +892,12 @@ def update_traveller_menu(username: str):
     
     pause()
 
+@returns_on_back
 def delete_traveller_menu(username: str):
     """Delete traveller"""
-    clear_screen()
-    show_header("Reiziger Verwijderen")
-    
-    customer_id = input("Customer ID van reiziger om te verwijderen: ").strip()
+    clear_and_header("Reiziger Verwijderen")
     
-    if check_back_command(customer_id):
-        return
+    customer_id = ask("Customer ID van reiziger om te verwijderen: ")
     
     if not customer_id:
         print("❌ Customer ID is verplicht")
@@ -976,13 +906,7 @@ def delete_traveller_menu(username: str):
     
     try:
         # Get traveller info for confirmation
-        travellers = get_all_travellers()
-        traveller_to_delete = None
-        
-        for t in travellers:
-            if t['customer_id'] == customer_id:
-                traveller_to_delete = t
-                break
+        traveller_to_delete = get_traveller_by_id(customer_id)
         
         if not traveller_to_delete:
             print(f"❌ Reiziger met ID {customer_id} niet gevonden")
@@ -998,9 +922,9 @@ def delete_traveller_menu(username: str):
         
         # Confirmation
         name = f"{traveller_to_delete['first_name']} {traveller_to_delete['last_name']}"
-        confirm = input(f"\n⚠️  Weet je zeker dat je reiziger {name} (ID: {customer_id}) wilt verwijderen? (ja/nee): ").strip().lower()
+        confirm = read_input(f"\n⚠️  Weet je zeker dat je reiziger {name} (ID: {customer_id}) wilt verwijderen? (ja/nee): ").strip().lower()
         
-        if confirm not in ['ja', 'j', 'yes', 'y']:
+        if confirm not in _YES:
             print("Verwijdering geannuleerd")
             pause()
             return
@@ -1022,100 +946,104 @@ def delete_traveller_menu(username: str):
 # SCOOTER MANAGEMENT FUNCTIONS  
 # ============================================================================
 
+_ADMIN_ROLES = frozenset({'super_admin', 'system_admin'})
+
+# Scooter submenu: (label, handler(username, role), roles that see it or None for everyone)
+_SCOOTER_MENU = (
+    ("Alle scooters bekijken", lambda username, role: view_all_scooters_menu(), None),
+    ("Scooter zoeken", lambda username, role: search_scooters_menu(), None),
+    ("Nieuwe scooter toevoegen", lambda username, role: create_scooter_menu(username), _ADMIN_ROLES),
+    ("Scooter bijwerken", lambda username, role: update_scooter_menu(username, role), _ADMIN_ROLES),
+    ("Scooter verwijderen", lambda username, role: delete_scooter_menu(username), _ADMIN_ROLES),
+    ("Scooter status bijwerken", lambda username, role: update_scooter_menu(username, role),
+     frozenset({'service_engineer'})),
+)
+
+@lru_cache(maxsize=None)
+def _scooter_menu_for_role(role: str) -> tuple:
+    """Handlers, back choice and rendered option list of the scooter submenu for a role"""
+    entries = [(label, handler) for label, handler, roles in _SCOOTER_MENU if roles is None or role in roles]
+    options = tuple(handler for _, handler in entries)
+    back = str(len(options) + 1)
+    menu_text = "".join(f"{i}. {label}\n" for i, (label, _) in enumerate(entries, 1))
+    menu_text += f"{back}. Terug naar hoofdmenu\n"
+    return options, back, menu_text
+
 def scooter_management_menu(username: str, role: str):
     """Scooter management submenu"""
+    options, back, menu_text = _scooter_menu_for_role(role)
+    
+    redraw = True
     while True:
-        clear_screen()
-        show_header("Scooter Beheer")
-        
-        options = ["Alle scooters bekijken", "Scooter zoeken"]
-        
-        if role in ['super_admin', 'system_admin']:
-            options.extend(["Nieuwe scooter toevoegen", "Scooter bijwerken", "Scooter verwijderen"])
-        elif role == 'service_engineer':
-            options.append("Scooter status bijwerken")
-        
-        options.append("Terug naar hoofdmenu")
+        if redraw:
+            clear_and_header("Scooter Beheer")
+            sys.stdout.write(menu_text)
+        redraw = True
         
-        for i, option in enumerate(options, 1):
-            print(f"{i}. {option}")
+        choice = read_input(f"\nKies een optie (1-{back}): ")
         
-        choice = input(f"\nKies een optie (1-{len(options)}): ")
-        
-        if check_back_command(choice) or choice == str(len(options)):
+        if check_back_command(choice) or choice == back:
             break
         
-        try:
-            choice_num = int(choice)
-            if choice_num == 1:
-                view_all_scooters_menu()
-            elif choice_num == 2:
-                search_scooters_menu()
-            elif choice_num == 3 and role in ['super_admin', 'system_admin']:
-                create_scooter_menu(username)
-            elif choice_num == 4 and role in ['super_admin', 'system_admin']:
-                update_scooter_menu(username, role)
-            elif choice_num == 3 and role == 'service_engineer':
-                update_scooter_menu(username, role)
-            elif choice_num == 5 and role in ['super_admin', 'system_admin']:
-                delete_scooter_menu(username)
-            else:
-                print("Ongeldige keuze.")
-                pause()
-        except ValueError:
+        choice = choice.strip()
+        if not choice.isdecimal():
             print("Voer een geldig nummer in.")
-            pause()
+            redraw = False
+            continue
+        
+        choice_num = int(choice)
+        if 1 <= choice_num <= len(options):
+            options[choice_num - 1](username, role)
+        else:
+            print("Ongeldige keuze.")
+            redraw = False
 
 def view_all_scooters_menu():
     """Display all scooters in formatted table"""
-    clear_screen()
-    show_header("Alle Scooters")
+    clear_and_header("Alle Scooters")
     
     try:
+        # Rows are formatted into one buffer and written with a single stdout write; the totals
+        # below come from a separate aggregate query
         scooters = get_all_scooters()
         if not scooters:
             print("Geen scooters gevonden.")
         else:
             # Define column widths and adjust for terminal
-            base_widths = [17, 12, 15, 10, 10, 20, 12]
-            widths = adjust_table_widths_for_terminal(base_widths)
-            headers = ['Serienummer', 'Merk', 'Model', 'Batterij %', 'Km-stand', 'Locatie', 'Status']
+            widths = adjust_table_widths_for_terminal(_SCOOTER_TABLE_WIDTHS)
             
-            show_table_header(headers, widths)
+            show_table_header(_SCOOTER_TABLE_HEADERS, widths)
             
+            lines = []
             for s in scooters:
-                status = "Buiten dienst" if s['out_of_service_status'] else "In dienst"
-                location = s['location'][:18] + "..." if len(s['location']) > 20 else s['location']
-                mileage = f"{s['mileage']:.1f}"
+                status = _SCOOTER_STATUS[bool(s['out_of_service_status'])]
                 values = [
                     s['serial_number'], s['brand'], s['model'], 
-                    f"{s['state_of_charge']}%", f"{mileage} km", 
-                    location, status
+                    f"{s['state_of_charge']}%", f"{s['mileage']:.1f} km", 
+                    s['location'], status
                 ]
-                print(format_table_row(values, widths))
+                lines.append(format_table_row(values, widths))
             
+            sys.stdout.write("\n".join(lines) + "\n")
             show_table_footer(widths)
-            print(f"\nTotaal: {len(scooters)} scooters")
+            total, in_service, avg_battery = get_scooter_stats()
+            print(f"\nTotaal: {total} scooters")
             
             # Quick statistics
-            in_service = sum(1 for s in scooters if not s['out_of_service_status'])
-            avg_battery = sum(s['state_of_charge'] for s in scooters) / len(scooters)
-            print(f"In dienst: {in_service}, Buiten dienst: {len(scooters)-in_service}")
+            print(f"In dienst: {in_service}, Buiten dienst: {total-in_service}")
             print(f"Gemiddelde batterij: {avg_battery:.1f}%")
     except Exception as e:
         print(f"❌ Fout bij ophalen scooters: {e}")
     
     pause()
 
+@returns_on_back
 def search_scooters_menu():
     """Search scooters"""
-    clear_screen()
-    show_header("Scooter Zoeken")
+    clear_and_header("Scooter Zoeken")
     
     try:
         search_term = get_validated_input_with_back("Zoekterm (merk, model, serienummer)", validate_search_term, "search_term")
-        if search_term is None:
-            return
         
         results = search_scooters(search_term)
         
@@ -1124,16 +1052,16 @@ def search_scooters_menu():
         else:
             print(f"\n{len(results)} resultaten gevonden voor '{search_term}':")
             
-            base_widths = [17, 12, 15, 10, 12]
-            widths = adjust_table_widths_for_terminal(base_widths)
-            headers = ['Serienummer', 'Merk', 'Model', 'Batterij %', 'Status']
+            widths = adjust_table_widths_for_terminal(_SCOOTER_SEARCH_TABLE_WIDTHS)
             
-            show_table_header(headers, widths)
+            show_table_header(_SCOOTER_SEARCH_TABLE_HEADERS, widths)
             
+            lines = []
             for s in results:
-                status = "Buiten dienst" if s['out_of_service_status'] else "In dienst"
+                status = _SCOOTER_STATUS[bool(s['out_of_service_status'])]
                 values = [s['serial_number'], s['brand'], s['model'], f"{s['state_of_charge']}%", status]
-                print(format_table_row(values, widths))
+                lines.append(format_table_row(values, widths))
+            sys.stdout.write("\n".join(lines) + "\n")
             
             show_table_footer(widths)
     except Exception as e:
@@ -1141,37 +1069,22 @@ def search_scooters_menu():
     
     pause()
 
+@returns_on_back
 def create_scooter_menu(username: str):
     """Add new scooter with all required fields"""
-    clear_screen()
-    show_header("Nieuwe Scooter Toevoegen")
+    clear_and_header("Nieuwe Scooter Toevoegen")
     
     try:
-        brand = get_validated_input_with_back("Merk", validate_brand_model, "brand")
-        if brand is None: return
-        
-        model = get_validated_input_with_back("Model", validate_brand_model, "model")
-        if model is None: return
-        
-        serial_number = get_validated_input_with_back("Serienummer (10-17 tekens)", validate_serial_number, "serial_number")
-        if serial_number is None: return
-        
-        top_speed = get_validated_input_with_back("Topsnelheid (km/h)", validate_positive_integer, "positive_integer")
-        if top_speed is None: return
-        
-        battery_capacity = get_validated_input_with_back("Batterijcapaciteit (Wh)", validate_positive_integer, "positive_integer")
-        if battery_capacity is None: return
-        
-        state_of_charge = get_validated_input_with_back("Huidige batterijlading (0-100%)", validate_percentage, "percentage")
-        if state_of_charge is None: return
+        fields = collect_validated_fields(_SCOOTER_FIELDS)
+        brand, model, serial_number = fields['brand'], fields['model'], fields['serial_number']
+        top_speed, battery_capacity = fields['top_speed'], fields['battery_capacity']
+        state_of_charge = fields['state_of_charge']
         
         # Target range SoC
         print("\nBatterijbereik instelling:")
         min_soc = get_validated_input_with_back("Minimum batterijniveau (%)", validate_percentage, "percentage")
-        if min_soc is None: return
         
         max_soc = get_validated_input_with_back("Maximum batterijniveau (%)", validate_percentage, "percentage")
-        if max_soc is None: return
         
         if not validate_soc_range(min_soc, max_soc):
             print("❌ Minimum moet kleiner zijn dan maximum")
@@ -1184,29 +1097,26 @@ def create_scooter_menu(username: str):
         print("\nGPS locatie:")
         print("Voorbeelden: 51.92250, 4.47917 of 51.9, 4.5")
         
-        latitude = input("Latitude: ").strip()
-        if check_back_command(latitude):
-            return
-        
-        longitude = input("Longitude: ").strip()
-        if check_back_command(longitude):
-            return
+        while True:
+            latitude = ask("Latitude: ")
+            
+            longitude = ask("Longitude: ")
+            
+            if validate_gps_number(latitude) and validate_gps_number(longitude):
+                break
+            print("❌ Ongeldige GPS coördinaten. Gebruik decimale getallen, bijv. 51.92250 en 4.47917.")
         
-        # Flexible validation - if they enter something reasonable, accept it
-        if validate_flexible_gps_coordinate(latitude, 'lat') and validate_flexible_gps_coordinate(longitude, 'lon'):
-            location = f"{latitude},{longitude}"
-        else:
+        # Flexible validation - numbers outside the Netherlands are accepted with a warning
+        if not (validate_flexible_gps_coordinate(latitude, 'lat') and validate_flexible_gps_coordinate(longitude, 'lon')):
             print("⚠️  GPS coördinaten lijken niet correct voor Nederland, maar worden toch opgeslagen.")
-            location = f"{latitude},{longitude}"
+        location = f"{latitude},{longitude}"
         
         # Service status
         print("\nService status:")
         print("1. In dienst (beschikbaar voor gebruik)")
         print("2. Buiten dienst (niet beschikbaar)")
         while True:
-            service_choice = input("Kies service status (1 of 2): ").strip()
-            if check_back_command(service_choice):
-                return
+            service_choice = ask("Kies service status (1 of 2): ")
             if service_choice == "1":
                 out_of_service_status = 0  # In service
                 print("✓ Scooter wordt ingesteld als 'In dienst'")
@@ -1220,12 +1130,9 @@ def create_scooter_menu(username: str):
         
         # Mileage
         mileage = get_validated_input_with_back("Huidige kilometerstand (km)", validate_positive_float, "positive_float")
-        if mileage is None: return
         
         # Flexible maintenance date
-        maintenance_date = input("Laatste onderhoudsdatum (bijv. 2024-03-15): ").strip()
-        if check_back_command(maintenance_date):
-            return
+        maintenance_date = ask("Laatste onderhoudsdatum (bijv. 2024-03-15): ")
         
         if maintenance_date:
             if validate_flexible_date(maintenance_date):
@@ -1251,32 +1158,33 @@ def create_scooter_menu(username: str):
         )
         
         if success:
-            status_text = "Buiten dienst" if out_of_service_status else "In dienst"
-            print(f"\n✅ Scooter succesvol toegevoegd!")
-            print(f"🛴 Serienummer: {serial_number}")
-            print(f"🏭 Merk/Model: {brand} {model}")
-            print(f"🔋 Batterij: {state_of_charge}%")
-            print(f"📍 Locatie: {location}")
-            print(f"🚦 Status: {status_text}")
-            print(f"🛣️  Kilometerstand: {mileage} km")
+            status_text = _SCOOTER_STATUS[out_of_service_status]
+            sys.stdout.write(
+                f"\n✅ Scooter succesvol toegevoegd!\n"
+                f"🛴 Serienummer: {serial_number}\n"
+                f"🏭 Merk/Model: {brand} {model}\n"
+                f"🔋 Batterij: {state_of_charge}%\n"
+                f"📍 Locatie: {location}\n"
+                f"🚦 Status: {status_text}\n"
+                f"🛣️  Kilometerstand: {mileage} km\n"
+            )
             log_event(f"Nieuwe scooter toegevoegd", username, 
                      f"Serienummer: {serial_number}, Merk: {brand} {model}, Locatie: {location}, Status: {status_text}, Km: {mileage}")
+        elif get_scooter_by_serial(serial_number):
+            print("\n❌ Fout bij toevoegen scooter: serienummer is al in gebruik")
         else:
-            print("\n❌ Fout bij toevoegen scooter (serienummer mogelijk al in gebruik)")
+            print("\n❌ Fout bij toevoegen scooter")
     except Exception as e:
         print(f"❌ Fout bij toevoegen scooter: {e}")
     
     pause()
 
+@returns_on_back
 def update_scooter_menu(username: str, role: str):
     """Update scooter based on user role - all fields editable"""
-    clear_screen()
-    show_header("Scooter Bijwerken")
+    clear_and_header("Scooter Bijwerken")
     
-    serial_number = input("Serienummer van scooter om bij te werken: ").strip()
-    
-    if check_back_command(serial_number):
-        return
+    serial_number = ask("Serienummer van scooter om bij te werken: ")
     
     if not serial_number:
         print("❌ Serienummer is verplicht")
@@ -1285,13 +1193,7 @@ def update_scooter_menu(username: str, role: str):
     
     try:
         # Get current scooter info
-        scooters = get_all_scooters()
-        current_scooter = None
-        
-        for s in scooters:
-            if s['serial_number'] == serial_number:
-                current_scooter = s
-                break
+        current_scooter = get_scooter_by_serial(serial_number)
         
         if not current_scooter:
             print(f"❌ Scooter met serienummer {serial_number} niet gevonden")
@@ -1299,113 +1201,41 @@ def update_scooter_menu(username: str, role: str):
             return
         
         # Display current info
-        print(f"\nHuidige gegevens van scooter {serial_number}:")
-        print(f"🏭 Merk/Model: {current_scooter['brand']} {current_scooter['model']}")
-        print(f"⚡ Topsnelheid: {current_scooter['top_speed']} km/h")
-        print(f"🔋 Batterijcapaciteit: {current_scooter['battery_capacity']} Wh")
-        print(f"🔋 Batterijlading: {current_scooter['state_of_charge']}%")
-        print(f"🎯 Batterijbereik: {current_scooter['target_range_soc']}")
-        print(f"📍 Locatie: {current_scooter['location']}")
-        print(f"🚦 Status: {'Buiten dienst' if current_scooter['out_of_service_status'] else 'In dienst'}")
-        print(f"🛣️  Kilometerstand: {current_scooter['mileage']} km")
+        details = _SCOOTER_DETAILS_TEMPLATE.format_map(
+            {**current_scooter, 'status': _SCOOTER_STATUS[bool(current_scooter['out_of_service_status'])]})
         if current_scooter['last_maintenance_date']:
-            print(f"🔧 Laatste onderhoud: {current_scooter['last_maintenance_date']}")
+            details += f"🔧 Laatste onderhoud: {current_scooter['last_maintenance_date']}\n"
+        sys.stdout.write(details)
         
         # Define which fields can be updated based on role
         if role == 'service_engineer':
             print("\n🔧 Als Service Engineer kun je bijwerken: batterijlading, locatie, status, kilometerstand, onderhoudsdatum")
-            allowed_fields = ['state_of_charge', 'location', 'out_of_service_status', 'mileage', 'last_maintenance_date']
         else:  # super_admin or system_admin
             print("\n👑 Als Administrator kun je alle velden bijwerken")
-            allowed_fields = ['brand', 'model', 'top_speed', 'battery_capacity', 'state_of_charge', 'target_range_soc', 'location', 'out_of_service_status', 'mileage', 'last_maintenance_date']
+        allowed_fields = SCOOTER_FIELDS_BY_ROLE.get(role, SCOOTER_FIELDS_BY_ROLE['super_admin'])
         
         # Collect updates
         updates = {}
         
         print("\nVoer nieuwe waarden in (laat leeg om ongewijzigd te laten):")
         
-        # Brand (admin only)
-        if 'brand' in allowed_fields:
-            while True:
-                new_brand = input(f"Merk ({current_scooter['brand']}): ").strip()
-                if check_back_command(new_brand):
-                    return
-                
-                if not new_brand:
-                    break
-                elif validate_brand_model(new_brand):
-                    updates['brand'] = new_brand
-                    break
-                else:
-                    print("❌ Ongeldige merk naam.")
-        
-        # Model (admin only)
-        if 'model' in allowed_fields:
-            while True:
-                new_model = input(f"Model ({current_scooter['model']}): ").strip()
-                if check_back_command(new_model):
-                    return
-                
-                if not new_model:
-                    break
-                elif validate_brand_model(new_model):
-                    updates['model'] = new_model
-                    break
-                else:
-                    print("❌ Ongeldige model naam.")
-        
-        # Top speed (admin only)
-        if 'top_speed' in allowed_fields:
-            while True:
-                new_top_speed = input(f"Topsnelheid ({current_scooter['top_speed']} km/h): ").strip()
-                if check_back_command(new_top_speed):
-                    return
-                
-                if not new_top_speed:
-                    break
-                elif validate_positive_integer(new_top_speed):
-                    updates['top_speed'] = int(new_top_speed)
-                    break
-                else:
-                    print("❌ Moet een positief getal zijn.")
-        
-        # Battery capacity (admin only)
-        if 'battery_capacity' in allowed_fields:
-            while True:
-                new_capacity = input(f"Batterijcapaciteit ({current_scooter['battery_capacity']} Wh): ").strip()
-                if check_back_command(new_capacity):
-                    return
-                
-                if not new_capacity:
-                    break
-                elif validate_positive_integer(new_capacity):
-                    updates['battery_capacity'] = int(new_capacity)
-                    break
-                else:
-                    print("❌ Moet een positief getal zijn.")
+        for field, label, unit, validator, convert, error in _SCOOTER_UPDATE_FIELDS:
+            if field not in allowed_fields:
+                continue
+            new_value = prompt_optional_field(f"{label} ({current_scooter[field]}{unit}): ", validator, error)
+            if new_value:
+                updates[field] = convert(new_value) if convert else new_value
         
         # Battery charge
         if 'state_of_charge' in allowed_fields:
-            new_soc = input(f"Batterijlading ({current_scooter['state_of_charge']}%): ").strip()
-            if check_back_command(new_soc):
-                return
-            
+            new_soc = prompt_optional_field(f"Batterijlading ({current_scooter['state_of_charge']}%): ",
+                                            validate_percentage, "❌ Batterijlading moet een getal van 0 tot 100 zijn.")
             if new_soc:
-                try:
-                    soc_value = int(new_soc)
-                    if 0 <= soc_value <= 100:
-                        updates['state_of_charge'] = soc_value
-                    else:
-                        print("⚠️  Batterijlading buiten normale range, maar wordt toch opgeslagen.")
-                        updates['state_of_charge'] = soc_value
-                except ValueError:
-                    print("❌ Moet een getal zijn voor batterijlading.")
+                updates['state_of_charge'] = int(new_soc)
         
         # Target range SoC (admin only)
         if 'target_range_soc' in allowed_fields:
-            new_target_range = input(f"Batterijbereik ({current_scooter['target_range_soc']}): ").strip()
-            if check_back_command(new_target_range):
-                return
+            new_target_range = ask(f"Batterijbereik ({current_scooter['target_range_soc']}): ")
             
             if new_target_range:
                 updates['target_range_soc'] = new_target_range
@@ -1413,31 +1243,31 @@ def update_scooter_menu(username: str, role: str):
         # GPS location
         if 'location' in allowed_fields:
             print("Nieuwe GPS locatie (laat beide leeg om ongewijzigd te laten):")
-            current_coords = current_scooter['location'].split(',') if ',' in current_scooter['location'] else ['', '']
+            current_lat, sep, current_lon = current_scooter['location'].partition(',')
+            if not sep:
+                current_lat = ''
             
             while True:
-                new_lat = input(f"Latitude (huidig: {current_coords[0] if len(current_coords) > 0 else ''}): ").strip()
-                if check_back_command(new_lat):
-                    return
+                new_lat = ask(f"Latitude (huidig: {current_lat}): ")
                 
-                new_lon = input(f"Longitude (huidig: {current_coords[1] if len(current_coords) > 1 else ''}): ").strip()
-                if check_back_command(new_lon):
-                    return
+                new_lon = ask(f"Longitude (huidig: {current_lon}): ")
                 
                 if not new_lat and not new_lon:
                     break
-                elif new_lat and new_lon:
+                elif not (new_lat and new_lon):
+                    print("❌ Voer beide coördinaten in of laat beide leeg.")
+                elif not (validate_gps_number(new_lat) and validate_gps_number(new_lon)):
+                    print("❌ Ongeldige GPS coördinaten. Gebruik decimale getallen, bijv. 51.92250 en 4.47917.")
+                else:
+                    if not (validate_flexible_gps_coordinate(new_lat, 'lat') and validate_flexible_gps_coordinate(new_lon, 'lon')):
+                        print("⚠️  GPS coördinaten lijken niet correct voor Nederland, maar worden toch opgeslagen.")
                     updates['location'] = f"{new_lat},{new_lon}"
                     break
-                else:
-                    print("❌ Voer beide coördinaten in of laat beide leeg.")
         
         # Service status
         if 'out_of_service_status' in allowed_fields:
             current_status = "buiten dienst" if current_scooter['out_of_service_status'] else "in dienst"
-            new_status = input(f"Status ({current_status}) - voer 'uit' in voor buiten dienst, 'in' voor in dienst: ").strip().lower()
-            if check_back_command(new_status):
-                return
+            new_status = ask(f"Status ({current_status}) - voer 'uit' in voor buiten dienst, 'in' voor in dienst: ").lower()
             if new_status in ['uit', 'buiten', 'out']:
                 updates['out_of_service_status'] = 1
             elif new_status in ['in', 'actief', 'active']:
@@ -1445,26 +1275,14 @@ def update_scooter_menu(username: str, role: str):
         
         # Mileage
         if 'mileage' in allowed_fields:
-            new_mileage = input(f"Kilometerstand ({current_scooter['mileage']} km): ").strip()
-            if check_back_command(new_mileage):
-                return
-            
+            new_mileage = prompt_optional_field(f"Kilometerstand ({current_scooter['mileage']} km): ",
+                                                validate_positive_float, "❌ Kilometerstand moet een getal van 0 of meer zijn.")
             if new_mileage:
-                try:
-                    mileage_value = float(new_mileage)
-                    if mileage_value >= 0:
-                        updates['mileage'] = mileage_value
-                    else:
-                        print("⚠️  Negatieve kilometerstand, maar wordt toch opgeslagen.")
-                        updates['mileage'] = mileage_value
-                except ValueError:
-                    print("❌ Moet een getal zijn voor kilometerstand.")
+                updates['mileage'] = float(new_mileage)
         
         # Maintenance date
         if 'last_maintenance_date' in allowed_fields:
-            new_maintenance = input(f"Laatste onderhoudsdatum ({current_scooter['last_maintenance_date'] or 'Niet bekend'}) (bijv. 2024-03-15): ").strip()
-            if check_back_command(new_maintenance):
-                return
+            new_maintenance = ask(f"Laatste onderhoudsdatum ({current_scooter['last_maintenance_date'] or 'Niet bekend'}) (bijv. 2024-03-15): ")
             
             if new_maintenance:
                 if validate_flexible_date(new_maintenance):
@@ -1491,15 +1309,12 @@ def update_scooter_menu(username: str, role: str):
     
     pause()
 
+@returns_on_back
 def delete_scooter_menu(username: str):
     """Delete scooter"""
-    clear_screen()
-    show_header("Scooter Verwijderen")
-    
-    serial_number = input("Serienummer van scooter om te verwijderen: ").strip()
+    clear_and_header("Scooter Verwijderen")
     
-    if check_back_command(serial_number):
-        return
+    serial_number = ask("Serienummer van scooter om te verwijderen: ")
     
     if not serial_number:
         print("❌ Serienummer is verplicht")
@@ -1508,13 +1323,7 @@ def delete_scooter_menu(username: str):
     
     try:
         # Get scooter info for confirmation
-        scooters = get_all_scooters()
-        scooter_to_delete = None
-        
-        for s in scooters:
-            if s['serial_number'] == serial_number:
-                scooter_to_delete = s
-                break
+        scooter_to_delete = get_scooter_by_serial(serial_number)
         
         if not scooter_to_delete:
             print(f"❌ Scooter met serienummer {serial_number} niet gevonden")
@@ -1531,9 +1340,9 @@ def delete_scooter_menu(username: str):
         
         # Confirmation
         brand_model = f"{scooter_to_delete['brand']} {scooter_to_delete['model']}"
-        confirm = input(f"\n⚠️  Weet je zeker dat je scooter {brand_model} (serienummer: {serial_number}) wilt verwijderen? (ja/nee): ").strip().lower()
+        confirm = read_input(f"\n⚠️  Weet je zeker dat je scooter {brand_model} (serienummer: {serial_number}) wilt verwijderen? (ja/nee): ").strip().lower()
         
-        if confirm not in ['ja', 'j', 'yes', 'y']:
+        if confirm not in _YES:
             print("Verwijdering geannuleerd")
             pause()
             return
@@ -1555,42 +1364,44 @@ def delete_scooter_menu(username: str):
 # BACKUP MANAGEMENT FUNCTIONS
 # ============================================================================
 
+# Backup submenu: (choice, label, handler(username, role), roles that see it or None for everyone)
+_BACKUP_MENU = (
+    ("1", "Backup maken", lambda username, role: create_new_backup(username), None),
+    ("2", "Beschikbare backups bekijken", lambda username, role: view_available_backups(), None),
+    ("3", "Backup herstellen", lambda username, role: restore_from_backup_interactive(username, role), None),
+    ("4", "Backup verwijderen", lambda username, role: delete_backup_interactive(username), frozenset({'super_admin'})),
+    ("5", "Backup statistieken", lambda username, role: show_backup_statistics(), frozenset({'super_admin'})),
+)
+
 def backup_management_menu(username: str, role: str):
     """Backup management submenu"""
+    options = {key: (label, handler) for key, label, handler, roles in _BACKUP_MENU
+               if roles is None or role in roles}
+    menu_text = "".join(f"{key}. {label}\n" for key, (label, _) in options.items())
+    menu_text += "0. Terug naar hoofdmenu\n"
+    
+    redraw = True
     while True:
-        clear_screen()
-        show_header("Backup Beheer")
-        
-        print("1. Backup maken")
-        print("2. Beschikbare backups bekijken")
-        print("3. Backup herstellen")
-        if role == 'super_admin':
-            print("4. Backup verwijderen")
-            print("5. Backup statistieken")
-        print("0. Terug naar hoofdmenu")
+        if redraw:
+            clear_and_header("Backup Beheer")
+            sys.stdout.write(menu_text)
+        redraw = True
         
-        choice = input("\nKies een optie: ")
+        choice = read_input("\nKies een optie: ")
         
         if check_back_command(choice) or choice == "0":
             break
-        elif choice == "1":
-            create_new_backup(username)
-        elif choice == "2":
-            view_available_backups()
-        elif choice == "3":
-            restore_from_backup_interactive(username, role)
-        elif choice == "4" and role == 'super_admin':
-            delete_backup_interactive(username)
-        elif choice == "5" and role == 'super_admin':
-            show_backup_statistics()
+        
+        option = options.get(choice)
+        if option:
+            option[1](username, role)
         else:
             print("Ongeldige keuze.")
-            pause()
+            redraw = False
 
 def create_new_backup(username: str):
     """Create new backup"""
-    clear_screen()
-    show_header("Backup Maken")
+    clear_and_header("Backup Maken")
     
     try:
         print("🔄 Backup wordt aangemaakt...")
@@ -1604,8 +1415,7 @@ def create_new_backup(username: str):
 
 def view_available_backups():
     """View available backups in formatted table"""
-    clear_screen()
-    show_header("Beschikbare Backups")
+    clear_and_header("Beschikbare Backups")
     
     try:
         backups = list_backups()
@@ -1614,21 +1424,20 @@ def view_available_backups():
             print("Geen backups gevonden.")
         else:
             # Define column widths and adjust for terminal
-            base_widths = [25, 20, 12, 15]
-            widths = adjust_table_widths_for_terminal(base_widths)
-            headers = ['Bestandsnaam', 'Aangemaakt', 'Grootte (MB)', 'Door']
+            widths = adjust_table_widths_for_terminal(_BACKUP_TABLE_WIDTHS)
             
-            show_table_header(headers, widths)
+            show_table_header(_BACKUP_TABLE_HEADERS, widths)
             
+            lines = []
             for backup in backups:
-                created_date = backup['created'].strftime('%d-%m-%Y %H:%M')
                 values = [
                     backup['filename'], 
-                    created_date, 
+                    backup['created_display'], 
                     f"{backup['size_mb']:.2f}", 
                     backup['creator']
                 ]
-                print(format_table_row(values, widths))
+                lines.append(format_table_row(values, widths))
+            sys.stdout.write("\n".join(lines) + "\n")
             
             show_table_footer(widths)
             print(f"\nTotaal: {len(backups)} backups")
@@ -1637,10 +1446,10 @@ def view_available_backups():
     
     pause()
 
+@returns_on_back
 def restore_from_backup_interactive(username: str, role: str):
     """Restore from backup interactively"""
-    clear_screen()
-    show_header("Backup Herstellen")
+    clear_and_header("Backup Herstellen")
     
     try:
         # Show available backups
@@ -1651,15 +1460,13 @@ def restore_from_backup_interactive(username: str, role: str):
             pause()
             return
         
-        print("Beschikbare backups:")
+        lines = ["Beschikbare backups:"]
         for i, backup in enumerate(backups, 1):
-            created_date = backup['created'].strftime('%d-%m-%Y %H:%M')
-            print(f"{i}. {backup['filename']} (aangemaakt: {created_date}, {backup['size_mb']:.1f}MB)")
+            lines.append(f"{i}. {backup['filename']} (aangemaakt: {backup['created_display']}, {backup['size_mb']:.1f}MB)")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         while True:
-            choice_input = input(f"\nKies backup (1-{len(backups)}): ")
-            if check_back_command(choice_input):
-                return
+            choice_input = ask(f"\nKies backup (1-{len(backups)}): ")
             
             try:
                 choice = int(choice_input) - 1
@@ -1675,18 +1482,16 @@ def restore_from_backup_interactive(username: str, role: str):
         # Check if restore code is needed
         restore_code = None
         if role != 'super_admin':
-            restore_code = input("Voer restore-code in: ").strip()
-            if check_back_command(restore_code):
-                return
+            restore_code = ask("Voer restore-code in: ")
             if not restore_code:
                 print("❌ Restore-code is verplicht voor System Administrators.")
                 pause()
                 return
         
         # Confirm restore
-        confirm = input(f"⚠️  Weet je zeker dat je backup {selected_backup} wilt herstellen?\nDit overschrijft de huidige data! (ja/nee): ").strip().lower()
+        confirm = read_input(f"⚠️  Weet je zeker dat je backup {selected_backup} wilt herstellen?\nDit overschrijft de huidige data! (ja/nee): ").strip().lower()
         
-        if confirm not in ['ja', 'j', 'yes', 'y']:
+        if confirm not in _YES:
             print("Restore geannuleerd.")
             pause()
             return
@@ -1705,10 +1510,10 @@ def restore_from_backup_interactive(username: str, role: str):
     
     pause()
 
+@returns_on_back
 def delete_backup_interactive(username: str):
     """Delete backup interactively (super admin only)"""
-    clear_screen()
-    show_header("Backup Verwijderen")
+    clear_and_header("Backup Verwijderen")
     
     try:
         backups = list_backups()
@@ -1718,15 +1523,13 @@ def delete_backup_interactive(username: str):
             pause()
             return
         
-        print("Beschikbare backups:")
+        lines = ["Beschikbare backups:"]
         for i, backup in enumerate(backups, 1):
-            created_date = backup['created'].strftime('%d-%m-%Y %H:%M')
-            print(f"{i}. {backup['filename']} (aangemaakt: {created_date})")
+            lines.append(f"{i}. {backup['filename']} (aangemaakt: {backup['created_display']})")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         while True:
-            choice_input = input(f"\nKies backup om te verwijderen (1-{len(backups)}): ")
-            if check_back_command(choice_input):
-                return
+            choice_input = ask(f"\nKies backup om te verwijderen (1-{len(backups)}): ")
             
             try:
                 choice = int(choice_input) - 1
@@ -1740,21 +1543,22 @@ def delete_backup_interactive(username: str):
         selected_backup = backups[choice]['filename']
         
         # Confirm deletion
-        confirm = input(f"⚠️  Weet je zeker dat je backup {selected_backup} wilt verwijderen? (ja/nee): ").strip().lower()
+        confirm = read_input(f"⚠️  Weet je zeker dat je backup {selected_backup} wilt verwijderen? (ja/nee): ").strip().lower()
         
-        if confirm not in ['ja', 'j', 'yes', 'y']:
+        if confirm not in _YES:
             print("Verwijdering geannuleerd.")
             pause()
             return
         
         # Delete backup
-        backup_path = os.path.join('backups', selected_backup)
-        if os.path.exists(backup_path):
-            os.remove(backup_path)
+        try:
+            os.unlink(os.path.join(BACKUP_DIR, selected_backup))
+        except FileNotFoundError:
+            print("❌ Backup bestand niet gevonden.")
+        else:
+            invalidate_backup_cache()
             print("✅ Backup succesvol verwijderd!")
             log_event(f"Backup verwijderd", username, f"Backup: {selected_backup}")
-        else:
-            print("❌ Backup bestand niet gevonden.")
     except Exception as e:
         print(f"❌ Fout bij verwijderen backup: {e}")
     
@@ -1762,23 +1566,25 @@ def delete_backup_interactive(username: str):
 
 def show_backup_statistics():
     """Show backup statistics"""
-    clear_screen()
-    show_header("Backup Statistieken")
+    clear_and_header("Backup Statistieken")
     
     try:
         stats = get_backup_statistics()
         
-        print(f"📊 Backup Overzicht:")
-        print(f"Totaal aantal backups: {stats['total_backups']}")
-        print(f"Totale grootte: {stats['total_size_mb']:.2f} MB")
+        lines = [
+            "📊 Backup Overzicht:",
+            f"Totaal aantal backups: {stats['total_backups']}",
+            f"Totale grootte: {stats['total_size_mb']:.2f} MB"
+        ]
         
         if stats['total_backups'] > 0:
-            print(f"Gemiddelde grootte: {stats['average_size_mb']:.2f} MB")
-            print(f"Nieuwste backup: {stats['newest_backup']}")
-            print(f"Oudste backup: {stats['oldest_backup']}")
+            lines.append(f"Gemiddelde grootte: {stats['average_size_mb']:.2f} MB")
+            lines.append(f"Nieuwste backup: {stats['newest_backup']}")
+            lines.append(f"Oudste backup: {stats['oldest_backup']}")
         
-        print(f"\n💾 Schijfruimte:")
-        print(f"Backup directory: {os.path.abspath('backups/')}")
+        lines.append("\n💾 Schijfruimte:")
+        lines.append(f"Backup directory: {BACKUP_DIR_ABS}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except Exception as e:
         print(f"❌ Fout bij ophalen statistieken: {e}")
@@ -1791,15 +1597,16 @@ def show_backup_statistics():
 
 def restore_code_management_menu(username: str, role: str):
     """Restore code management (super admin only)"""
+    redraw = True
     while True:
-        clear_screen()
-        show_header("Restore-Code Beheer")
-        
-        print("1. Restore-code genereren")
-        print("2. Restore-code intrekken")
-        print("3. Terug naar hoofdmenu")
+        if redraw:
+            clear_and_header("Restore-Code Beheer")
+            sys.stdout.write("1. Restore-code genereren\n"
+                             "2. Restore-code intrekken\n"
+                             "3. Terug naar hoofdmenu\n")
+        redraw = True
         
-        choice = input("\nKies een optie (1-3): ")
+        choice = read_input("\nKies een optie (1-3): ")
         
         if check_back_command(choice) or choice == "3":
             break
@@ -1809,12 +1616,26 @@ def restore_code_management_menu(username: str, role: str):
             revoke_restore_code_interactive_menu(username)
         else:
             print("Ongeldige keuze.")
-            pause()
+            redraw = False
+
+def new_restore_code() -> str:
+    """Return a fresh one-time restore code"""
+    # 12 base32 characters (A-Z, 2-7) from a single CSPRNG read, 60 bits of entropy
+    return base64.b32encode(secrets.token_bytes(8)).decode('ascii')[:12]
+
+def generate_restore_codes_bulk(pairs, username: str) -> list:
+    """Generate restore codes for (system_admin_username, backup_name) pairs and store them in one batch"""
+    rows = [(new_restore_code(), admin, backup) for admin, backup in pairs]
+    if not rows or not add_restore_codes_bulk(rows):
+        return []
+    log_events_bulk([(f"Restore-code gegenereerd", username, f"Code voor {admin}, Backup: {backup}", False)
+                     for code, admin, backup in rows])
+    return rows
 
+@returns_on_back
 def generate_restore_code_interactive(username: str):
     """Generate restore code interactively"""
-    clear_screen()
-    show_header("Restore-Code Genereren")
+    clear_and_header("Restore-Code Genereren")
     
     try:
         # Show available backups
@@ -1826,82 +1647,91 @@ def generate_restore_code_interactive(username: str):
             return
         
         # Show system admins
-        users = get_all_users()
-        system_admins = [u for u in users if u['role'] == 'system_admin']
+        system_admins = get_users_by_role('system_admin')
         
         if not system_admins:
             print("Geen System Administrators gevonden.")
             pause()
             return
         
+        # Displayed number -> username
+        admin_options = {}
         print("System Administrators:")
         for i, admin in enumerate(system_admins, 1):
             print(f"{i}. {admin['username']} ({admin['first_name']} {admin['last_name']})")
+            admin_options[i] = admin['username']
+        print("A. Alle System Administrators")
         
         while True:
-            admin_input = input(f"\nKies System Administrator (1-{len(system_admins)}): ")
-            if check_back_command(admin_input):
-                return
+            admin_input = ask(f"\nKies System Administrator (1-{len(admin_options)}, A voor allemaal): ")
+            if admin_input.strip().upper() == "A":
+                selected_admin = None
+                break
             
             try:
-                admin_choice = int(admin_input) - 1
-                if 0 <= admin_choice < len(system_admins):
+                selected_admin = admin_options.get(int(admin_input))
+                if selected_admin:
                     break
                 else:
                     print("❌ Ongeldige keuze.")
             except ValueError:
                 print("❌ Voer een geldig nummer in.")
         
-        selected_admin = system_admins[admin_choice]['username']
-        
+        # Displayed number -> backup filename
+        backup_options = {}
         print("\nBeschikbare backups:")
         for i, backup in enumerate(backups, 1):
-            created_date = backup['created'].strftime('%d-%m-%Y %H:%M')
-            print(f"{i}. {backup['filename']} (aangemaakt: {created_date})")
+            print(f"{i}. {backup['filename']} (aangemaakt: {backup['created_display']})")
+            backup_options[i] = backup['filename']
         
         while True:
-            backup_input = input(f"\nKies backup (1-{len(backups)}): ")
-            if check_back_command(backup_input):
-                return
+            backup_input = ask(f"\nKies backup (1-{len(backup_options)}): ")
             
             try:
-                backup_choice = int(backup_input) - 1
-                if 0 <= backup_choice < len(backups):
+                selected_backup = backup_options.get(int(backup_input))
+                if selected_backup:
                     break
                 else:
                     print("❌ Ongeldige keuze.")
             except ValueError:
                 print("❌ Voer een geldig nummer in.")
         
-        selected_backup = backups[backup_choice]['filename']
-        
-        # Generate code
-        code = ''.join(secrets.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789') for _ in range(12))
-        success = add_restore_code(code, selected_admin, selected_backup)
-        
-        if success:
-            print(f"\n✅ Restore-code succesvol gegenereerd!")
-            print(f"🔑 Code: {code}")
-            print(f"👤 Voor: {selected_admin}")
-            print(f"💾 Backup: {selected_backup}")
-            print("\n⚠️  Deze code is eenmalig bruikbaar!")
-            log_event(f"Restore-code gegenereerd", username, f"Code voor {selected_admin}, Backup: {selected_backup}")
+        if selected_admin is None:
+            # One code per system admin, stored and logged in a single batch
+            rows = generate_restore_codes_bulk([(admin, selected_backup) for admin in admin_options.values()],
+                                               username)
+            if rows:
+                print(f"\n✅ {len(rows)} restore-codes succesvol gegenereerd voor backup {selected_backup}!")
+                for code, admin, _ in rows:
+                    print(f"🔑 {code}  👤 {admin}")
+                print("\n⚠️  Elke code is eenmalig bruikbaar!")
+            else:
+                print("❌ Fout bij genereren restore-codes.")
         else:
-            print("❌ Fout bij genereren restore-code.")
+            # Generate code
+            code = new_restore_code()
+            success = add_restore_code(code, selected_admin, selected_backup)
+            
+            if success:
+                print(f"\n✅ Restore-code succesvol gegenereerd!")
+                print(f"🔑 Code: {code}")
+                print(f"👤 Voor: {selected_admin}")
+                print(f"💾 Backup: {selected_backup}")
+                print("\n⚠️  Deze code is eenmalig bruikbaar!")
+                log_event(f"Restore-code gegenereerd", username, f"Code voor {selected_admin}, Backup: {selected_backup}")
+            else:
+                print("❌ Fout bij genereren restore-code.")
     except Exception as e:
         print(f"❌ Fout bij genereren restore-code: {e}")
     
     pause()
 
+@returns_on_back
 def revoke_restore_code_interactive_menu(username: str):
     """Revoke restore code"""
-    clear_screen()
-    show_header("Restore-Code Intrekken")
-    
-    code = input("Restore-code om in te trekken: ").strip().upper()
+    clear_and_header("Restore-Code Intrekken")
     
-    if check_back_command(code):
-        return
+    code = ask("Restore-code om in te trekken: ").upper()
     
     if not code:
         print("❌ Restore-code is verplicht")
@@ -1923,9 +1753,9 @@ def revoke_restore_code_interactive_menu(username: str):
         print(f"📅 Aangemaakt: {code_info['created_date'][:10]}")
         
         # Confirmation
-        confirm = input("⚠️  Weet je zeker dat je deze code wilt intrekken? (ja/nee): ").strip().lower()
+        confirm = read_input("⚠️  Weet je zeker dat je deze code wilt intrekken? (ja/nee): ").strip().lower()
         
-        if confirm not in ['ja', 'j', 'yes', 'y']:
+        if confirm not in _YES:
             print("Intrekking geannuleerd")
             pause()
             return
@@ -1947,63 +1777,68 @@ def revoke_restore_code_interactive_menu(username: str):
 # VERBETERDE LOGGING FUNCTIONS
 # ============================================================================
 
+def format_log_rows(logs, widths: list, start: int = 1) -> list:
+    """Format log entries as numbered table rows"""
+    # Every row has all columns, so the row template is looked up once per render
+    row_template = _table_row_template(tuple(widths))
+    lines = []
+    for i, log in enumerate(logs, start):
+        # Split timestamp into date and time
+        timestamp_parts = log['timestamp'][:19].split('T') if log['timestamp'] else ['...', '...']
+        date_part = timestamp_parts[0] if len(timestamp_parts) > 0 and timestamp_parts[0] else "..."
+        time_part = timestamp_parts[1] if len(timestamp_parts) > 1 and timestamp_parts[1] else "..."
+        
+        username_display = user if (user := log['username']) and user.strip() else "..."
+        description = desc if (desc := log['description']) and desc.strip() else "..."
+        
+        values = (i, date_part, time_part, username_display, description,
+                  _LOG_SUSPICIOUS_LABELS[bool(log['suspicious'])])
+        lines.append(row_template.format(*_fit_cells(values, widths)))
+    return lines
+
 def view_logs_menu(username: str, role: str):
     """View system logs in formatted table with pagination"""
-    clear_screen()
-    show_header("Systeem Logs")
+    clear_and_header("Systeem Logs")
     
     try:
-        logs = get_logs()
-        if not logs:
+        # Only counts are read up front; each page is fetched on its own
+        total_logs, suspicious_count = get_log_counts()
+        if not total_logs:
             print("Geen logs gevonden.")
             pause()
             return
         
         # Pagination settings
         logs_per_page = 25
-        total_pages = (len(logs) + logs_per_page - 1) // logs_per_page
+        total_pages = (total_logs + logs_per_page - 1) // logs_per_page
         current_page = 1
         
         while True:
-            clear_screen()
-            show_header("Systeem Logs")
+            clear_and_header("Systeem Logs")
             
             # Calculate start and end indices for current page
             start_idx = (current_page - 1) * logs_per_page
-            end_idx = min(start_idx + logs_per_page, len(logs))
-            current_logs = logs[start_idx:end_idx]
+            current_logs = get_log_page(start_idx, logs_per_page)
+            end_idx = start_idx + len(current_logs)
             
             # Show page info
-            print(f"📄 Pagina {current_page} van {total_pages} (logs {start_idx + 1}-{end_idx} van {len(logs)})")
+            print(f"📄 Pagina {current_page} van {total_pages} (logs {start_idx + 1}-{end_idx} van {total_logs})")
             print()
             
             # Define column widths - ZONDER Info kolom
-            base_widths = [3, 12, 8, 15, 35, 8]
-            widths = adjust_table_widths_for_terminal(base_widths)
-            headers = ['Nr', 'Datum', 'Tijd', 'Gebruiker', 'Beschrijving', 'Verdacht']
+            widths = adjust_table_widths_for_terminal(_LOG_TABLE_WIDTHS)
             
-            show_table_header(headers, widths)
+            show_table_header(_LOG_TABLE_HEADERS, widths)
             
             # Show current page logs
-            for i, log in enumerate(current_logs, start_idx + 1):
-                # Split timestamp into date and time
-                timestamp_parts = log['timestamp'][:19].split('T') if log['timestamp'] else ['...', '...']
-                date_part = timestamp_parts[0] if len(timestamp_parts) > 0 and timestamp_parts[0] else "..."
-                time_part = timestamp_parts[1] if len(timestamp_parts) > 1 and timestamp_parts[1] else "..."
-                
-                username_display = log['username'] if log['username'] and log['username'].strip() else "..."
-                description = log['description'] if log['description'] and log['description'].strip() else "..."
-                suspicious = "Ja" if log['suspicious'] else "Nee"
-                
-                values = [i, date_part, time_part, username_display, description, suspicious]
-                print(format_table_row(values, widths))
+            lines = format_log_rows(current_logs, widths, start_idx + 1)
+            sys.stdout.write("\n".join(lines) + "\n")
             
             show_table_footer(widths)
             
             # Show suspicious activity summary
-            suspicious_logs = [log for log in logs if log['suspicious']]
-            if suspicious_logs:
-                print(f"\n⚠️  Totaal verdachte activiteiten: {len(suspicious_logs)}")
+            if suspicious_count:
+                print(f"\n⚠️  Totaal verdachte activiteiten: {suspicious_count}")
             
             # Show navigation options - ALLEEN HIER, GEEN DUBBELE
             print("\nNavigatie opties:")
@@ -2025,7 +1860,7 @@ def view_logs_menu(username: str, role: str):
                 print(f"  {option}")
             
             # Get user choice
-            choice = input("\nKies een optie: ").strip().lower()
+            choice = read_input("\nKies een optie: ").strip().lower()
             
             if choice == 't' or check_back_command(choice):
                 break
@@ -2035,7 +1870,7 @@ def view_logs_menu(username: str, role: str):
                 current_page += 1
             elif choice == 'g':
                 try:
-                    page_num = int(input(f"Ga naar pagina (1-{total_pages}): "))
+                    page_num = int(read_input(f"Ga naar pagina (1-{total_pages}): "))
                     if 1 <= page_num <= total_pages:
                         current_page = page_num
                     else:
@@ -2045,9 +1880,9 @@ def view_logs_menu(username: str, role: str):
                     print("❌ Voer een geldig paginanummer in.")
                     pause()
             elif choice == 'a':
-                show_all_logs(logs)
+                show_all_logs(get_logs())
             elif choice == 's':
-                show_suspicious_logs_only(suspicious_logs)
+                show_suspicious_logs_only(get_suspicious_logs())
             else:
                 print("❌ Ongeldige keuze.")
                 pause()
@@ -2058,30 +1893,17 @@ def view_logs_menu(username: str, role: str):
 
 def show_all_logs(logs):
     """Show all logs without pagination"""
-    clear_screen()
-    show_header("Alle Systeem Logs")
+    clear_and_header("Alle Systeem Logs")
     
     print(f"📋 Totaal {len(logs)} logs:\n")
     
     # Define column widths - ZONDER Info kolom
-    base_widths = [3, 12, 8, 15, 35, 8]
-    widths = adjust_table_widths_for_terminal(base_widths)
-    headers = ['Nr', 'Datum', 'Tijd', 'Gebruiker', 'Beschrijving', 'Verdacht']
+    widths = adjust_table_widths_for_terminal(_LOG_TABLE_WIDTHS)
     
-    show_table_header(headers, widths)
+    show_table_header(_LOG_TABLE_HEADERS, widths)
     
-    for i, log in enumerate(logs, 1):
-        # Split timestamp into date and time
-        timestamp_parts = log['timestamp'][:19].split('T') if log['timestamp'] else ['...', '...']
-        date_part = timestamp_parts[0] if len(timestamp_parts) > 0 and timestamp_parts[0] else "..."
-        time_part = timestamp_parts[1] if len(timestamp_parts) > 1 and timestamp_parts[1] else "..."
-        
-        username_display = log['username'] if log['username'] and log['username'].strip() else "..."
-        description = log['description'] if log['description'] and log['description'].strip() else "..."
-        suspicious = "Ja" if log['suspicious'] else "Nee"
-        
-        values = [i, date_part, time_part, username_display, description, suspicious]
-        print(format_table_row(values, widths))
+    lines = format_log_rows(logs, widths)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     show_table_footer(widths)
     print(f"\n📊 Overzicht: {len(logs)} logs getoond")
@@ -2089,8 +1911,7 @@ def show_all_logs(logs):
 
 def show_suspicious_logs_only(suspicious_logs):
     """Show only suspicious logs"""
-    clear_screen()
-    show_header("Verdachte Activiteiten")
+    clear_and_header("Verdachte Activiteiten")
     
     if not suspicious_logs:
         print("✅ Geen verdachte activiteiten gevonden.")
@@ -2100,24 +1921,12 @@ def show_suspicious_logs_only(suspicious_logs):
     print(f"⚠️  {len(suspicious_logs)} verdachte activiteiten gevonden:\n")
     
     # Define column widths - ZONDER Info kolom
-    base_widths = [3, 12, 8, 15, 35, 8]
-    widths = adjust_table_widths_for_terminal(base_widths)
-    headers = ['Nr', 'Datum', 'Tijd', 'Gebruiker', 'Beschrijving', 'Verdacht']
+    widths = adjust_table_widths_for_terminal(_LOG_TABLE_WIDTHS)
     
-    show_table_header(headers, widths)
+    show_table_header(_LOG_TABLE_HEADERS, widths)
     
-    for i, log in enumerate(suspicious_logs, 1):
-        # Split timestamp into date and time
-        timestamp_parts = log['timestamp'][:19].split('T') if log['timestamp'] else ['...', '...']
-        date_part = timestamp_parts[0] if len(timestamp_parts) > 0 and timestamp_parts[0] else "..."
-        time_part = timestamp_parts[1] if len(timestamp_parts) > 1 and timestamp_parts[1] else "..."
-        
-        username_display = log['username'] if log['username'] and log['username'].strip() else "..."
-        description = log['description'] if log['description'] and log['description'].strip() else "..."
-        suspicious = "Ja"  # All logs in this function are suspicious
-        
-        values = [i, date_part, time_part, username_display, description, suspicious]
-        print(format_table_row(values, widths))
+    lines = format_log_rows(suspicious_logs, widths)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     show_table_footer(widths)
     print(f"\n⚠️  Totaal {len(suspicious_logs)} verdachte activiteiten")
@@ -2127,28 +1936,22 @@ def show_suspicious_logs_only(suspicious_logs):
 # PASSWORD CHANGE FUNCTION
 # ============================================================================
 
+@returns_on_back
 def change_password_menu(username: str, role: str):
     """Change user password"""
-    clear_screen()
-    show_header("Wachtwoord Wijzigen")
-    
     if username == 'super_admin':
         print("⚠️  Super admin wachtwoord kan niet gewijzigd worden.")
         pause()
         return
     
+    clear_and_header("Wachtwoord Wijzigen")
+    
     try:
-        old_password = input("Huidig wachtwoord: ")
-        if check_back_command(old_password):
-            return
+        old_password = ask("Huidig wachtwoord: ")
         
         new_password = get_validated_input_with_back("Nieuw wachtwoord", validate_password, "password")
-        if new_password is None:
-            return
         
-        confirm_password = input("Bevestig nieuw wachtwoord: ")
-        if check_back_command(confirm_password):
-            return
+        confirm_password = ask("Bevestig nieuw wachtwoord: ")
         
         if new_password != confirm_password:
             print("❌ Wachtwoorden komen niet overeen.")
@@ -2171,26 +1974,27 @@ def change_password_menu(username: str, role: str):
 
 def show_statistics_menu():
     """Show system statistics in formatted layout"""
-    clear_screen()
-    show_header("Systeem Statistieken")
+    clear_and_header("Systeem Statistieken")
     
     try:
-        travellers = get_all_travellers()
-        scooters = get_all_scooters()
-        users = get_all_users()
+        stats = get_statistics()
+        if stats is None:
+            print("❌ Fout bij ophalen statistieken")
+            pause()
+            return
         
         print("📊 ALGEMEEN OVERZICHT")
         print("=" * 50)
-        print(f"👥 Totaal aantal gebruikers:     {len(users):>8}")
-        print(f"🧳 Totaal aantal reizigers:      {len(travellers):>8}")
-        print(f"🛴 Totaal aantal scooters:       {len(scooters):>8}")
-        
-        if scooters:
-            in_service = sum(1 for s in scooters if not s['out_of_service_status'])
-            out_of_service = len(scooters) - in_service
-            avg_battery = sum(s['state_of_charge'] for s in scooters) / len(scooters)
-            total_mileage = sum(s['mileage'] for s in scooters)
-            avg_mileage = total_mileage / len(scooters)
+        print(f"👥 Totaal aantal gebruikers:     {stats['users']:>8}")
+        print(f"🧳 Totaal aantal reizigers:      {stats['travellers']:>8}")
+        print(f"🛴 Totaal aantal scooters:       {stats['scooters']:>8}")
+        
+        if stats['scooters']:
+            in_service = stats['in_service']
+            out_of_service = stats['scooters'] - in_service
+            avg_battery = stats['avg_battery']
+            total_mileage = stats['total_mileage']
+            avg_mileage = total_mileage / stats['scooters']
             
             print(f"\n🛴 SCOOTER STATISTIEKEN")
             print("=" * 50)
@@ -2201,42 +2005,35 @@ def show_statistics_menu():
             print(f"📊 Gemiddelde km per scooter:    {avg_mileage:>7.1f} km")
             
             # Battery status distribution
-            low_battery = sum(1 for s in scooters if s['state_of_charge'] < 20)
-            medium_battery = sum(1 for s in scooters if 20 <= s['state_of_charge'] < 80)
-            high_battery = sum(1 for s in scooters if s['state_of_charge'] >= 80)
-            
             print(f"\n🔋 BATTERIJ VERDELING")
             print("=" * 50)
-            print(f"🔴 Laag (< 20%):                 {low_battery:>8}")
-            print(f"🟡 Gemiddeld (20-80%):           {medium_battery:>8}")
-            print(f"🟢 Hoog (> 80%):                 {high_battery:>8}")
+            print(f"🔴 Laag (< 20%):                 {stats['low_battery']:>8}")
+            print(f"🟡 Gemiddeld (20-80%):           {stats['medium_battery']:>8}")
+            print(f"🟢 Hoog (> 80%):                 {stats['high_battery']:>8}")
         
-        if travellers:
-            cities = {}
-            for t in travellers:
-                cities[t['city']] = cities.get(t['city'], 0) + 1
-            
+        if stats['cities']:
             print(f"\n🏙️  REIZIGERS PER STAD")
             print("=" * 50)
-            for city, count in sorted(cities.items(), key=lambda x: x[1], reverse=True):
+            for city, count in stats['cities']:
                 print(f"{city:<25} {count:>8}")
         
         # User role distribution
-        if users:
-            roles = {}
-            for u in users:
-                role_name = {
-                    'super_admin': 'Super Administrator',
-                    'system_admin': 'System Administrator', 
-                    'service_engineer': 'Service Engineer'
-                }.get(u['role'], u['role'])
-                roles[role_name] = roles.get(role_name, 0) + 1
-            
+        if stats['roles']:
             print(f"\n👤 GEBRUIKERS PER ROL")
             print("=" * 50)
-            for role, count in sorted(roles.items()):
+            for role, count in sorted((ROLE_LABELS.get(role, role), count) for role, count in stats['roles']):
                 print(f"{role:<25} {count:>8}")
         
+        # Log activity, counted by SQLite without decrypting any entry
+        logs = get_logs_summary()
+        if logs['total_logs']:
+            print(f"\n📋 LOG ACTIVITEIT")
+            print("=" * 50)
+            print(f"Totaal aantal logs:           {logs['total_logs']:>8}")
+            print(f"Verdachte activiteiten:       {logs['suspicious_count']:>8}")
+            print(f"Logs laatste 24 uur:          {logs['recent_logs']:>8}")
+            print(f"Laatste activiteit:           {logs['last_activity'][:19].replace('T', ' ')}")
+        
         # Show backup information
         try:
             stats = get_backup_statistics()
@@ -2258,8 +2055,45 @@ def show_statistics_menu():
 # MAIN APPLICATION LOOP
 # ============================================================================
 
+def enable_line_editing():
+    """Enable readline line editing for input() on an interactive terminal"""
+    if not sys.stdin.isatty():
+        return
+    try:
+        import readline
+        # Passwords are typed through input(), so keep them out of the recall history
+        readline.set_auto_history(False)
+    except (ImportError, AttributeError):
+        pass  # readline not available (e.g. Windows)
+
+_LOGIN_MENU_TEXT = (
+    "🔐 Voor demonstratie doeleinden:\n"
+    "   Username: super_admin\n"
+    "   Password: Admin_123?\n"
+    "\n"
+    "1. Inloggen\n"
+    "2. Afsluiten\n"
+)
+
+# Main menu action -> handler(username, role); "logout" and "exit" are handled by main()
+_MAIN_ACTIONS = {
+    "user_management": user_management_menu,
+    "traveller_management": traveller_management_menu,
+    "scooter_management": scooter_management_menu,
+    "search_scooters": lambda username, role: search_scooters_menu(),
+    "update_scooter_info": update_scooter_menu,
+    "view_logs": view_logs_menu,
+    "backup_management": backup_management_menu,
+    "restore_code_management": restore_code_management_menu,
+    "change_password": change_password_menu,
+    "show_statistics": lambda username, role: show_statistics_menu(),
+}
+
 def main():
     """Main application function"""
+    enable_line_editing()
+    enable_ansi_output()
+    
     # Initialize database
     print("🚀 Urban Mobility Backend System wordt gestart...")
     
@@ -2270,27 +2104,27 @@ def main():
         print(f"❌ Fout bij database initialisatie: {e}")
         sys.exit(1)
     
+    # Encryption self-test runs once at startup instead of on every import
+    if not validate_encryption_setup():
+        print("⚠️ WAARSCHUWING: Encryptie validatie mislukt! Systeem is mogelijk niet veilig.")
+    
+    redraw = True
     while True:
-        clear_screen()
-        show_header("Urban Mobility Backend System - Inloggen", False)
-        
-        print("🔐 Voor demonstratie doeleinden:")
-        print("   Username: super_admin")
-        print("   Password: Admin_123?")
-        print()
-        print("1. Inloggen")
-        print("2. Afsluiten")
+        if redraw:
+            clear_and_header("Urban Mobility Backend System - Inloggen", False)
+            sys.stdout.write(_LOGIN_MENU_TEXT)
+        redraw = True
         
-        choice = input("\nKies een optie (1-2): ")
+        choice = read_input("\nKies een optie (1-2): ")
         
         if choice == "1":
-            username = input("Gebruikersnaam: ").strip()
+            username = read_input("Gebruikersnaam: ").strip()
             if not username:
                 print("❌ Gebruikersnaam is verplicht")
                 pause()
                 continue
                 
-            password = input("Wachtwoord: ")
+            password = read_input("Wachtwoord: ")
             if not password:
                 print("❌ Wachtwoord is verplicht")
                 pause()
@@ -2314,31 +2148,13 @@ def main():
                     elif action == "exit":
                         print("👋 Tot ziens!")
                         sys.exit(0)
-                    elif action == "user_management":
-                        result = user_management_menu(actual_username, role)
-                        if result == "force_logout":
-                            break  # Exit to login screen
-                    elif action == "traveller_management":
-                        traveller_management_menu(actual_username, role)
-                    elif action == "scooter_management":
-                        scooter_management_menu(actual_username, role)
-                    elif action == "search_scooters":
-                        search_scooters_menu()
-                    elif action == "update_scooter_info":
-                        update_scooter_menu(actual_username, role)
-                    elif action == "view_logs":
-                        view_logs_menu(actual_username, role)
-                    elif action == "backup_management":
-                        backup_management_menu(actual_username, role)
-                    elif action == "restore_code_management":
-                        restore_code_management_menu(actual_username, role)
-                    elif action == "change_password":
-                        change_password_menu(actual_username, role)
-                    elif action == "show_statistics":
-                        show_statistics_menu()
-                    else:
+                    
+                    handler = _MAIN_ACTIONS.get(action)
+                    if handler is None:
                         print(f"❌ Functie '{action}' nog niet geïmplementeerd.")
                         pause()
+                    elif handler(actual_username, role) == "force_logout":
+                        break  # Exit to login screen
             else:
                 print("\n❌ Login mislukt. Controleer gebruikersnaam en wachtwoord.")
                 print("🔄 Probeer het opnieuw...")
@@ -2349,7 +2165,7 @@ def main():
             sys.exit(0)
         else:
             print("❌ Ongeldige keuze. Kies 1 of 2.")
-            pause()
+            redraw = False
 
 if __name__ == '__main__':
     try:
@@ -0,0 +1,30 @@
+import pytest
+
+
+@pytest.fixture
+def fresh_db(tmp_path, monkeypatch):
+    """Point db at an empty database file and start with cold caches"""
+    # The modules keep their data under a relative data/ directory and encryption.py creates its key
+    # there on first import, so db is only imported once the test runs from its own scratch directory
+    monkeypatch.chdir(tmp_path)
+    import db
+    monkeypatch.setattr(db, 'DB_PATH', str(tmp_path / 'data.db'))
+    db.reset_connections()
+    db.invalidate_read_cache()
+    db.init_db()
+    yield db
+    db.flush_logs()
+    db.reset_connections()
+    db.invalidate_read_cache()
+
+
+@pytest.fixture
+def auth(fresh_db):
+    import auth
+    return auth
+
+
+@pytest.fixture
+def um_members(fresh_db):
+    import um_members
+    return um_members
@@ -0,0 +1,23 @@
+def _register(auth, db, username='jdoe_user', password='Old_Passw0rd!'):
+    assert db.add_user(username, auth.hash_password(password), 'service_engineer', 'Jan', 'Doe')
+    return username, password
+
+
+def test_wrong_old_password_is_logged_even_with_invalid_new_password(auth, fresh_db, monkeypatch):
+    username, _ = _register(auth, fresh_db)
+    events = []
+    monkeypatch.setattr(auth, 'log_event', lambda description, *args, **kwargs: events.append(description))
+
+    success, message = auth.change_own_password(username, 'Wrong_Passw0rd!', 'short')
+
+    assert not success
+    assert message == "Huidig wachtwoord is incorrect"
+    assert events == ["Mislukte wachtwoord wijziging"]
+
+
+def test_invalid_new_password_is_rejected_after_old_password_check(auth, fresh_db):
+    username, password = _register(auth, fresh_db)
+
+    assert auth.change_own_password(username, password, 'short') == (False, "Nieuw wachtwoord voldoet niet aan eisen")
+    assert auth.change_own_password(username, password, 'New_Passw0rd!!')[0]
+    assert auth.check_password('New_Passw0rd!!', fresh_db.get_user_by_username(username)['password_hash'])
@@ -0,0 +1,191 @@
+import sqlite3
+
+import pytest
+
+
+def _add_scooter(db, serial_number, brand='Segway', model='Ninebot', location='51.92250,4.47917', **kwargs):
+    return db.add_scooter(brand, model, serial_number, 25, 500, 80, '20-80', location, **kwargs)
+
+
+def test_update_keeps_working_on_legacy_location(fresh_db):
+    # Older versions stored any text as a location; such rows bypass the triggers via raw SQL here
+    db = fresh_db
+    assert _add_scooter(db, 'SN0000000001')
+    with db.get_db() as conn:
+        conn.execute('DROP TRIGGER validate_scooter_update')
+        conn.execute("UPDATE scooters SET location='Rotterdam,Centrum' WHERE serial_number='SN0000000001'")
+        conn.commit()
+    db.init_db()
+
+    assert db.update_scooter('SN0000000001', 'service_engineer', state_of_charge=40)
+    assert db.get_scooter_by_serial('SN0000000001')['state_of_charge'] == 40
+
+
+def test_update_rejects_invalid_changed_values(fresh_db):
+    db = fresh_db
+    assert _add_scooter(db, 'SN0000000001')
+
+    assert not db.update_scooter('SN0000000001', 'service_engineer', location='Rotterdam,Centrum')
+    assert not db.update_scooter('SN0000000001', 'service_engineer', state_of_charge=101)
+    assert not db.update_scooter('SN0000000001', 'service_engineer', mileage=-1)
+    scooter = db.get_scooter_by_serial('SN0000000001')
+    assert (scooter['location'], scooter['state_of_charge'], scooter['mileage']) == ('51.92250,4.47917', 80, 0.0)
+
+
+def test_insert_rejects_invalid_location(fresh_db):
+    db = fresh_db
+    assert not _add_scooter(db, 'SN0000000001', location='Rotterdam')
+    with db.get_db() as conn:
+        try:
+            conn.execute("INSERT INTO scooters (serial_number, brand, model, top_speed, battery_capacity, "
+                         "state_of_charge, target_range_soc, location, in_service_date) "
+                         "VALUES ('SN0000000002', 'a', 'b', 25, 500, 50, '20-80', '51.9,', '2024-01-01')")
+        except sqlite3.IntegrityError as e:
+            assert db._SCOOTER_INVALID_MESSAGE in str(e)
+        else:
+            raise AssertionError('insert with an empty longitude was accepted')
+    assert db.get_scooter_by_serial('SN0000000001') is None
+
+
+def test_add_scooter_rejects_duplicate_serial_quietly(fresh_db, capsys):
+    db = fresh_db
+    assert _add_scooter(db, 'SN0000000001')
+    assert not _add_scooter(db, 'SN0000000001', brand='Other')
+    assert capsys.readouterr().out == ''
+    assert db.get_scooter_by_serial('SN0000000001')['brand'] == 'Segway'
+
+
+def _fts_serials(db):
+    with db.get_db() as conn:
+        return sorted(serial for (serial,) in conn.execute('SELECT serial_number FROM scooter_fts'))
+
+
+def _search_serials(db, term):
+    return [scooter['serial_number'] for scooter in db.search_scooters(term)]
+
+
+def test_scooter_fts_follows_insert_update_and_delete(fresh_db):
+    db = fresh_db
+    if not db._scooter_fts:
+        pytest.skip('SQLite build without FTS5 trigram support')
+    assert _add_scooter(db, 'SN0000000001', brand='Segway')
+    assert _add_scooter(db, 'SN0000000002', brand='Niu')
+    assert _fts_serials(db) == ['SN0000000001', 'SN0000000002']
+    assert _search_serials(db, 'segw') == ['SN0000000001']
+
+    assert db.update_scooter('SN0000000001', 'super_admin', brand='Xiaomi')
+    assert _search_serials(db, 'segw') == []
+    assert _search_serials(db, 'xiao') == ['SN0000000001']
+
+    assert db.delete_scooter('SN0000000002')
+    assert _fts_serials(db) == ['SN0000000001']
+    assert _search_serials(db, '0002') == []
+
+
+def test_init_db_rebuilds_rowid_keyed_fts_index(fresh_db):
+    db = fresh_db
+    if not db._scooter_fts:
+        pytest.skip('SQLite build without FTS5 trigram support')
+    assert _add_scooter(db, 'SN0000000001', brand='Segway')
+    with db.get_db() as conn:
+        # Layout of the index before it was keyed on serial_number
+        for trigger in ('scooter_fts_insert', 'scooter_fts_delete', 'scooter_fts_update'):
+            conn.execute(f'DROP TRIGGER {trigger}')
+        conn.execute('DROP TABLE scooter_fts')
+        conn.execute("CREATE VIRTUAL TABLE scooter_fts USING fts5(search_text, tokenize='trigram')")
+        conn.commit()
+    db.init_db()
+
+    assert _fts_serials(db) == ['SN0000000001']
+    assert _search_serials(db, 'segw') == ['SN0000000001']
+
+
+def test_cached_reads_are_invalidated_by_writes(fresh_db):
+    db = fresh_db
+    assert _add_scooter(db, 'SN0000000001', brand='Segway')
+    assert [s['serial_number'] for s in db.get_all_scooters()] == ['SN0000000001']
+    assert _search_serials(db, 'Segway') == ['SN0000000001']
+    assert db.get_scooter_stats() == (1, 1, 80.0)
+
+    assert _add_scooter(db, 'SN0000000002', brand='Segway')
+    assert [s['serial_number'] for s in db.get_all_scooters()] == ['SN0000000001', 'SN0000000002']
+    assert _search_serials(db, 'Segway') == ['SN0000000001', 'SN0000000002']
+
+    assert db.update_scooter('SN0000000002', 'service_engineer', state_of_charge=40, out_of_service_status=1)
+    assert db.get_scooter_stats() == (2, 1, 60.0)
+
+    assert db.delete_scooter('SN0000000001')
+    assert [s['serial_number'] for s in db.get_all_scooters()] == ['SN0000000002']
+    assert _search_serials(db, 'Segway') == ['SN0000000002']
+
+
+def test_cached_user_and_traveller_reads_are_invalidated_by_writes(fresh_db):
+    db = fresh_db
+    assert db.get_all_users() == ()
+    assert db.add_user('jdoe_user', 'hash', 'service_engineer', 'Jan', 'Doe')
+    assert [u['username'] for u in db.get_all_users()] == ['jdoe_user']
+    assert [u['username'] for u in db.get_users_by_role('service_engineer')] == ['jdoe_user']
+    assert db.update_user('jdoe_user', role='system_admin')
+    assert db.get_users_by_role('service_engineer') == ()
+
+    assert db.search_travellers('Jansen') == ()
+    customer_id = db.add_traveller('Piet', 'Jansen', '1990-01-01', 'male', 'Straat', '1', '1234AB',
+                                   'Rotterdam', 'piet@example.com', '12345678', 'AB1234567')
+    assert [t['customer_id'] for t in db.search_travellers('Jansen')] == [customer_id]
+    assert db.update_traveller(customer_id, email_address='piet@example.org')
+    assert db.get_all_travellers()[0]['email_address'] == 'piet@example.org'
+    assert db.delete_traveller(customer_id)
+    assert db.search_travellers('Jansen') == ()
+
+
+def test_init_db_drops_the_numeric_location_copy(fresh_db):
+    db = fresh_db
+    assert _add_scooter(db, 'SN0000000001')
+    with db.get_db() as conn:
+        # Layout of databases created while the coordinates were also stored as numbers
+        conn.execute('ALTER TABLE scooters ADD COLUMN latitude REAL')
+        conn.execute('ALTER TABLE scooters ADD COLUMN longitude REAL')
+        conn.execute('CREATE INDEX idx_scooter_geo ON scooters(latitude, longitude)')
+        conn.commit()
+    db.init_db()
+
+    with db.get_db() as conn:
+        columns = {column[1] for column in conn.execute('PRAGMA table_info(scooters)')}
+    assert not {'latitude', 'longitude'} & columns
+    assert db.update_scooter('SN0000000001', 'service_engineer', location='51.91000,4.48000')
+    assert db.get_scooter_by_serial('SN0000000001')['location'] == '51.91000,4.48000'
+
+
+def test_cached_records_are_read_only(fresh_db):
+    db = fresh_db
+    assert _add_scooter(db, 'SN0000000001', brand='Segway')
+    for scooters in (db.get_all_scooters(), db.search_scooters('Segway')):
+        with pytest.raises(TypeError):
+            scooters[0]['brand'] = 'Changed'
+    assert db.get_all_scooters()[0]['brand'] == 'Segway'
+    assert db.search_scooters('Segway')[0]['brand'] == 'Segway'
+
+
+def test_unknown_username_does_not_rebuild_the_index(fresh_db, monkeypatch):
+    db = fresh_db
+    assert db.add_user('jdoe_user', 'hash', 'service_engineer', 'Jan', 'Doe')
+    assert db.get_user_by_username('JDOE_USER')['username'] == 'jdoe_user'
+
+    decrypted = []
+    monkeypatch.setattr(db, 'decrypt_data', lambda value: decrypted.append(value) or value)
+    assert db.get_user_by_username('unknown_1') is None
+    assert db.get_user_by_username('unknown_2') is None
+    assert decrypted == []
+
+
+def test_logs_summary_counts_without_decrypting(fresh_db, monkeypatch):
+    db = fresh_db
+    db.log_event('Ingelogd', 'jdoe_user')
+    db.log_event('Mislukte login', 'jdoe_user', suspicious=True)
+    db.flush_logs()
+    monkeypatch.setattr(db, 'decrypt_data', lambda value: pytest.fail('log entry decrypted'))
+
+    summary = db.get_logs_summary()
+
+    assert (summary['total_logs'], summary['suspicious_count'], summary['recent_logs']) == (2, 1, 2)
+    assert summary['last_activity']
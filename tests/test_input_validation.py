@@ -0,0 +1,40 @@
+import pytest
+
+import input_validation
+
+
+def _stdin(monkeypatch, *lines):
+    answers = iter(lines)
+
+    def fake_input(prompt=''):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr('builtins.input', fake_input)
+
+
+def test_end_of_input_exits_cleanly(monkeypatch):
+    _stdin(monkeypatch)
+    with pytest.raises(SystemExit) as exc_info:
+        input_validation.read_input('> ')
+    assert exc_info.value.code == 0
+
+
+def test_end_of_input_is_not_swallowed_by_broad_handlers(monkeypatch):
+    _stdin(monkeypatch)
+    with pytest.raises(SystemExit):
+        try:
+            input_validation.ask('> ')
+        except Exception:
+            pass
+
+
+def test_back_command_escapes_broad_handlers(monkeypatch):
+    _stdin(monkeypatch, ' Terug ')
+    with pytest.raises(input_validation.BackException):
+        try:
+            input_validation.get_validated_input_with_back('Voornaam', input_validation.validate_name, 'name')
+        except Exception:
+            pass
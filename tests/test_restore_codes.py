@@ -0,0 +1,35 @@
+def test_bulk_generation_stores_and_logs_every_code(um_members, fresh_db):
+    db = fresh_db
+    rows = um_members.generate_restore_codes_bulk([('admin_one', 'backup_a.zip'), ('admin_two', 'backup_a.zip')],
+                                                  'super_admin')
+
+    assert [(admin, backup) for _, admin, backup in rows] == [('admin_one', 'backup_a.zip'),
+                                                              ('admin_two', 'backup_a.zip')]
+    assert len({code for code, _, _ in rows}) == 2
+    for code, admin, backup in rows:
+        stored = db.get_restore_code(code)
+        assert (stored['system_admin_username'], stored['backup_name'], stored['used']) == (admin, backup, 0)
+    assert [log['description'] for log in db.get_logs()] == ["Restore-code gegenereerd"] * 2
+
+
+def test_bulk_generation_without_pairs_stores_nothing(um_members, fresh_db):
+    assert um_members.generate_restore_codes_bulk([], 'super_admin') == []
+    assert fresh_db.get_database_stats()['active_restore_codes'] == 0
+
+
+def test_menu_generates_a_code_for_every_system_admin(um_members, fresh_db, monkeypatch):
+    db = fresh_db
+    for username in ('admin_one', 'admin_two'):
+        assert db.add_user(username, 'hash', 'system_admin', 'Sys', 'Admin')
+    monkeypatch.setattr(um_members, 'list_backups',
+                        lambda: [{'filename': 'backup_a.zip', 'created_display': '2024-01-01 12:00'}])
+    answers = iter(['A', '1'])
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    monkeypatch.setattr(um_members, 'pause', lambda: None)
+    monkeypatch.setattr(um_members, 'clear_and_header', lambda title: None)
+
+    um_members.generate_restore_code_interactive('super_admin')
+
+    with db.get_db() as conn:
+        assert conn.execute('SELECT COUNT(*) FROM restore_codes WHERE backup_name = ?',
+                            ('backup_a.zip',)).fetchone()[0] == 2